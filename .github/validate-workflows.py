@@ -9,57 +9,87 @@ from pathlib import Path
 
 import yaml
 
+# Use the libyaml C parser when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def validate_workflow_file(filepath):
-    """Validate a single workflow file"""
-    print(f"INFO: Validating {filepath}...")
+WORKFLOWS_DIR = Path(".github/workflows")
+
+
+def find_workflow_files(workflows_dir=WORKFLOWS_DIR):
+    """
+    Find the workflow files in a directory
+
+    Args:
+        workflows_dir: Directory holding the workflow files
+
+    Returns:
+        list: Sorted paths of the .yml and .yaml files
+    """
+    workflows_dir = Path(workflows_dir)
+    return sorted(
+        list(workflows_dir.glob("*.yml")) + list(workflows_dir.glob("*.yaml"))
+    )
+
+
+def validate_workflow_file(filepath, log=print):
+    """
+    Validate a single workflow file
+
+    Args:
+        filepath: Workflow file path
+        log: Callable that receives each progress or error message
+
+    Returns:
+        bool: True if the workflow is valid
+    """
+    log(f"INFO: Validating {filepath}...")
 
     try:
         with open(filepath, "r") as f:
-            workflow = yaml.safe_load(f)
+            workflow = yaml.load(f, Loader=SafeLoader)
 
         # Basic structure validation
         required_keys = ["name", "jobs"]
         for key in required_keys:
             if key not in workflow:
-                print(f"  ERROR: Missing required key: {key}")
+                log(f"  ERROR: Missing required key: {key}")
                 return False
 
         # Check for 'on' key (which might be parsed as True due to YAML
         # boolean interpretation)
         has_trigger = "on" in workflow or True in workflow
         if not has_trigger:
-            print("  ERROR: Missing workflow trigger ('on' key)")
+            log("  ERROR: Missing workflow trigger ('on' key)")
             return False
 
         # Validate jobs structure
         jobs = workflow.get("jobs", {})
         if not isinstance(jobs, dict) or not jobs:
-            print("  ERROR: No jobs defined")
+            log("  ERROR: No jobs defined")
             return False
 
         # Validate each job
         for job_name, job_config in jobs.items():
             if not isinstance(job_config, dict):
-                print(f"  ERROR: Job '{job_name}' is not a dictionary")
+                log(f"  ERROR: Job '{job_name}' is not a dictionary")
                 return False
 
             if "runs-on" not in job_config:
-                print(f"  ERROR: Job '{job_name}' missing 'runs-on'")
+                log(f"  ERROR: Job '{job_name}' missing 'runs-on'")
                 return False
 
             if "steps" not in job_config:
-                print(f"  ERROR: Job '{job_name}' missing 'steps'")
+                log(f"  ERROR: Job '{job_name}' missing 'steps'")
                 return False
 
-        print(f"  SUCCESS: Valid workflow with {len(jobs)} jobs")
+        log(f"  SUCCESS: Valid workflow with {len(jobs)} jobs")
         return True
 
     except yaml.YAMLError as e:
-        print(f"  ERROR: YAML syntax error: {e}")
+        log(f"  ERROR: YAML syntax error: {e}")
         return False
     except Exception as e:
-        print(f"  ERROR: Validation error: {e}")
+        log(f"  ERROR: Validation error: {e}")
         return False
 
 
@@ -68,15 +98,13 @@ def main():
     print("DEPLOY: GitHub Actions Workflow Validator")
     print("=" * 50)
 
-    workflows_dir = Path(".github/workflows")
+    workflows_dir = WORKFLOWS_DIR
 
     if not workflows_dir.exists():
         print("ERROR: .github/workflows directory not found")
         sys.exit(1)
 
-    workflow_files = list(workflows_dir.glob("*.yml")) + list(
-        workflows_dir.glob("*.yaml")
-    )
+    workflow_files = find_workflow_files(workflows_dir)
 
     if not workflow_files:
         print("ERROR: No workflow files found")
@@ -85,7 +113,7 @@ def main():
     valid_count = 0
     total_count = len(workflow_files)
 
-    for workflow_file in sorted(workflow_files):
+    for workflow_file in workflow_files:
         if validate_workflow_file(workflow_file):
             valid_count += 1
         print()
@@ -21,6 +21,7 @@ def cleanup_files():
         ".pytest_cache",
         # Log files
         "logs/api_monitor.log",
+        "logs/api_metrics.jsonl",
         # Temporary monitoring files
         "reports/monitoring_summary.json",
     ]
@@ -3,8 +3,13 @@
 Demo script to test the MLOps API endpoints
 """
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Seconds to wait for the API before giving up on a request
+REQUEST_TIMEOUT = 10
 
 
 def test_api_endpoints():
@@ -26,28 +31,100 @@ def test_api_endpoints():
         "Longitude": -122.23,  # Longitude (San Francisco area)
     }
 
+    # Create 3 different houses for the batch prediction
+    houses = [
+        sample_house,  # Expensive SF house
+        {
+            **sample_house,
+            "MedInc": 3.5,
+            "Latitude": 34.05,
+            "Longitude": -118.24,
+        },  # LA house
+        {
+            **sample_house,
+            "MedInc": 2.0,
+            "HouseAge": 15.0,
+            "Latitude": 32.71,
+            "Longitude": -117.16,
+        },  # San Diego house
+    ]
+
+    # Test with missing features
+    incomplete_house = {"MedInc": 8.0, "HouseAge": 25.0}  # Missing other features
+
+    # Reuse kept-alive connections for all requests
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    with session, ThreadPoolExecutor(max_workers=4) as executor:
+        return _run_demo(
+            session, executor, base_url, sample_house, houses, incomplete_house
+        )
+
+
+def _run_demo(session, executor, base_url, sample_house, houses, incomplete_house):
+    """Run the demo requests and print their results in order"""
+    if not _print_health(session, base_url):
+        return False
+
+    # The remaining requests are independent, so send them concurrently and
+    # print each result in turn as it is needed
+    info_future = executor.submit(
+        session.get, f"{base_url}/info", timeout=REQUEST_TIMEOUT
+    )
+    predict_future = executor.submit(
+        session.post, f"{base_url}/predict", json=sample_house, timeout=REQUEST_TIMEOUT
+    )
+    batch_future = executor.submit(
+        session.post,
+        f"{base_url}/predict_batch",
+        json={"instances": houses},
+        timeout=REQUEST_TIMEOUT,
+    )
+    error_future = executor.submit(
+        session.post,
+        f"{base_url}/predict",
+        json=incomplete_house,
+        timeout=REQUEST_TIMEOUT,
+    )
+
+    _print_model_info(info_future)
+    _print_prediction(predict_future, sample_house)
+    _print_batch_predictions(batch_future)
+    _print_error_handling(error_future)
+
+    print("\n" + "=" * 50)
+    print("API Demo Complete!")
+    print("The API is working correctly and ready for production!")
+
+    return True
+
+
+def _print_health(session, base_url):
+    """Print the health check result and return whether the API is healthy"""
     # 1. Health Check
     print("\n1. Health Check")
     print("-" * 30)
     try:
-        response = requests.get(f"{base_url}/health")
+        response = session.get(f"{base_url}/health", timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             data = response.json()
             print(f"Status: {data['status']}")
             print(f"Message: {data['message']}")
-        else:
-            print(f"Health check failed: {response.status_code}")
-            return False
+            return True
+        print(f"Health check failed: {response.status_code}")
     except Exception as e:
         print(f"Cannot connect to API: {e}")
         print("Make sure to start the API server first: python src/api.py")
-        return False
+    return False
+
 
+def _print_model_info(info_future):
+    """Print the model information response"""
     # 2. Model Info
     print("\n2. Model Information")
     print("-" * 30)
     try:
-        response = requests.get(f"{base_url}/info")
+        response = info_future.result()
         data = response.json()
         print(f"Model Type: {data['model_type']}")
         print(f"Features: {len(data['features'])}")
@@ -55,6 +132,9 @@ def test_api_endpoints():
     except Exception as e:
         print(f"Model info failed: {e}")
 
+
+def _print_prediction(predict_future, sample_house):
+    """Print the sample house and its predicted price"""
     # 3. Single Prediction
     print("\n3. Single House Price Prediction")
     print("-" * 30)
@@ -63,11 +143,7 @@ def test_api_endpoints():
         print(f"   {key}: {value}")
 
     try:
-        response = requests.post(
-            f"{base_url}/predict",
-            json=sample_house,
-            headers={"Content-Type": "application/json"},
-        )
+        response = predict_future.result()
         data = response.json()
         predicted_price = data["prediction"]
         print(f"\nPredicted Price: ${predicted_price:.2f} (in hundreds of thousands)")
@@ -76,34 +152,15 @@ def test_api_endpoints():
     except Exception as e:
         print(f"Prediction failed: {e}")
 
+
+def _print_batch_predictions(batch_future):
+    """Print the batch prediction response"""
     # 4. Batch Predictions
     print("\n4. Batch Predictions (3 houses)")
     print("-" * 30)
 
-    # Create 3 different houses
-    houses = [
-        sample_house,  # Expensive SF house
-        {
-            **sample_house,
-            "MedInc": 3.5,
-            "Latitude": 34.05,
-            "Longitude": -118.24,
-        },  # LA house
-        {
-            **sample_house,
-            "MedInc": 2.0,
-            "HouseAge": 15.0,
-            "Latitude": 32.71,
-            "Longitude": -117.16,
-        },  # San Diego house
-    ]
-
     try:
-        response = requests.post(
-            f"{base_url}/predict_batch",
-            json={"instances": houses},
-            headers={"Content-Type": "application/json"},
-        )
+        response = batch_future.result()
         data = response.json()
         predictions = data["predictions"]
 
@@ -116,19 +173,15 @@ def test_api_endpoints():
     except Exception as e:
         print(f"Batch prediction failed: {e}")
 
+
+def _print_error_handling(error_future):
+    """Print the response to a request with missing features"""
     # 5. Error Handling Demo
     print("\n5. Error Handling Demo")
     print("-" * 30)
 
-    # Test with missing features
-    incomplete_house = {"MedInc": 8.0, "HouseAge": 25.0}  # Missing other features
-
     try:
-        response = requests.post(
-            f"{base_url}/predict",
-            json=incomplete_house,
-            headers={"Content-Type": "application/json"},
-        )
+        response = error_future.result()
         if response.status_code == 400:
             error_data = response.json()
             print(f"Error handling works: {error_data['error']}")
@@ -137,12 +190,6 @@ def test_api_endpoints():
     except Exception as e:
         print(f"Error test failed: {e}")
 
-    print("\n" + "=" * 50)
-    print("API Demo Complete!")
-    print("The API is working correctly and ready for production!")
-
-    return True
-
 
 if __name__ == "__main__":
     print("Starting API demo...")
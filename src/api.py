@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import List, Optional
 
 import joblib
+import numpy as np
 import pandas as pd
 from flask import Flask, jsonify, request
 from prometheus_client import (
@@ -112,6 +113,23 @@ validation_errors = Counter(
     "input_validation_errors_total", "Total input validation errors", ["error_type"]
 )
 
+# Artifact locations read by load_model_and_scaler
+MODEL_PATH = "models/best_model.pkl"
+SCALER_PATH = "data/scaler.pkl"
+FEATURE_DATA_PATH = "data/X_train.csv"
+
+# California Housing feature names, used when no training data is available
+DEFAULT_FEATURE_NAMES = [
+    "MedInc",
+    "HouseAge",
+    "AveRooms",
+    "AveBedrms",
+    "Population",
+    "AveOccup",
+    "Latitude",
+    "Longitude",
+]
+
 # Global variables for model and scaler
 model = None
 scaler = None
@@ -129,7 +147,7 @@ def load_model_and_scaler():
 
     try:
         # Load model
-        model_path = "models/best_model.pkl"
+        model_path = MODEL_PATH
         if os.path.exists(model_path):
             model = joblib.load(model_path)
             logger.info(f"Model loaded from {model_path}")
@@ -137,7 +155,7 @@ def load_model_and_scaler():
             raise FileNotFoundError(f"Model file not found: {model_path}")
 
         # Load scaler
-        scaler_path = "data/scaler.pkl"
+        scaler_path = SCALER_PATH
         if os.path.exists(scaler_path):
             scaler = joblib.load(scaler_path)
             logger.info(f"Scaler loaded from {scaler_path}")
@@ -145,23 +163,14 @@ def load_model_and_scaler():
             raise FileNotFoundError(f"Scaler file not found: {scaler_path}")
 
         # Load feature names from training data
-        feature_data_path = "data/X_train.csv"
+        feature_data_path = FEATURE_DATA_PATH
         if os.path.exists(feature_data_path):
             sample_data = pd.read_csv(feature_data_path, nrows=1)
             feature_names = list(sample_data.columns)
             logger.info(f"Feature names loaded: {feature_names}")
         else:
             # Default California Housing feature names
-            feature_names = [
-                "MedInc",
-                "HouseAge",
-                "AveRooms",
-                "AveBedrms",
-                "Population",
-                "AveOccup",
-                "Latitude",
-                "Longitude",
-            ]
+            feature_names = list(DEFAULT_FEATURE_NAMES)
             logger.warning(f"Using default feature names: {feature_names}")
 
     except Exception as e:
@@ -169,6 +178,25 @@ def load_model_and_scaler():
         raise
 
 
+def set_model(new_model, new_scaler, new_feature_names=None):
+    """
+    Install an already loaded model and scaler without reading from disk
+
+    Args:
+        new_model: Fitted model
+        new_scaler: Fitted StandardScaler
+        new_feature_names: Feature names in model input order; defaults to
+            the California Housing features
+    """
+    global model, scaler, feature_names
+
+    model = new_model
+    scaler = new_scaler
+    feature_names = list(
+        new_feature_names if new_feature_names is not None else DEFAULT_FEATURE_NAMES
+    )
+
+
 def validate_input(data):
     """
     Validate input data format and values
@@ -184,18 +212,7 @@ def validate_input(data):
 
     # If feature_names is not loaded, use default
     expected_features = (
-        feature_names
-        if feature_names is not None
-        else [
-            "MedInc",
-            "HouseAge",
-            "AveRooms",
-            "AveBedrms",
-            "Population",
-            "AveOccup",
-            "Latitude",
-            "Longitude",
-        ]
+        feature_names if feature_names is not None else DEFAULT_FEATURE_NAMES
     )
 
     # Check if all required features are present
@@ -542,8 +559,13 @@ def predict_batch():
                     400,
                 )
 
-        # Prepare input data
-        input_df = pd.DataFrame(instances)[feature_names]
+        # Prepare input data as one contiguous array rather than a DataFrame
+        # inferred from a list of dicts
+        input_array = np.asarray(
+            [[instance[name] for name in feature_names] for instance in instances],
+            dtype=np.float64,
+        )
+        input_df = pd.DataFrame(input_array, columns=feature_names)
 
         # Scale the input
         input_scaled = scaler.transform(input_df)
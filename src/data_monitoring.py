@@ -6,7 +6,7 @@ Monitors data drift, performance degradation, and triggers retraining
 import json
 import logging
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple
 
 import joblib
@@ -284,12 +284,15 @@ class RetrainingTrigger:
                 if os.path.exists("models/best_model_metrics.json"):
                     with open("models/best_model_metrics.json", "r") as f:
                         metrics = json.load(f)
+                        now = datetime.now(timezone.utc)
                         last_training = datetime.fromisoformat(
-                            metrics.get(
-                                "training_timestamp", datetime.now().isoformat()
-                            )
+                            metrics.get("training_timestamp", now.isoformat())
                         )
-                        days_since_training = (datetime.now() - last_training).days
+                        # Timestamps written before they carried an offset are
+                        # naive; treat them as UTC
+                        if last_training.tzinfo is None:
+                            last_training = last_training.replace(tzinfo=timezone.utc)
+                        days_since_training = (now - last_training).days
 
                         if (
                             days_since_training
@@ -3,18 +3,186 @@ In-memory database logging system for MLOps pipeline
 Uses SQLite in-memory database for storing logs and metrics
 """
 
+import atexit
 import json
 import logging
+import os
+import queue
 import sqlite3
 import threading
+import weakref
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+# orjson is a faster drop-in encoder; fall back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _to_json(data: Optional[Dict]) -> Optional[str]:
+    """
+    Serialize a dictionary for storage in a TEXT column
+
+    Args:
+        data: Dictionary to serialize
+
+    Returns:
+        JSON string, or None if there is nothing to store
+    """
+    if not data:
+        return None
+    if orjson is not None:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        return orjson.dumps(data, option=options).decode()
+    return json.dumps(data)
+
+
+# Maximum number of queued inserts the writer thread commits per transaction
+WRITE_BATCH_SIZE = 512
+
+# Maximum number of inserts waiting for the writer thread; logging calls block
+# once it is reached rather than growing the queue without bound
+WRITE_QUEUE_SIZE = 1000
+
+# Sentinel that tells the writer thread to exit
+_STOP_WRITER = object()
+
+# Marks a queued LogRecord that the writer thread converts to a logs row
+_LOG_RECORD = object()
+
+# Loggers with a running writer thread, flushed once at interpreter exit
+_live_loggers = weakref.WeakSet()
+
+
+def _flush_live_loggers():
+    """Commit anything still queued by the open loggers"""
+    for live_logger in list(_live_loggers):
+        live_logger.flush()
+
+
+atexit.register(_flush_live_loggers)
+
+# Standard LogRecord attributes; anything else on a record is stored as extra data
+_RECORD_ATTRS = frozenset(
+    [
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "message",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "taskName",
+    ]
+)
+
+INSERT_LOG_SQL = """
+    INSERT INTO logs (level, module, message, extra_data)
+    VALUES (?, ?, ?, ?)
+"""
+
+INSERT_API_METRIC_SQL = """
+    INSERT INTO api_metrics (endpoint, method, status_code, response_time,
+                             success, error_message, request_data, response_data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_MODEL_METRIC_SQL = """
+    INSERT INTO model_metrics (model_name, model_type, rmse, mae,
+                               r2_score, training_time, parameters)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _record_fields(record: logging.LogRecord) -> tuple:
+    """
+    Extract the logs table fields from a log record
+
+    Args:
+        record: LogRecord instance
+
+    Returns:
+        tuple: (level, module, message, extra_data dictionary)
+    """
+    # Extract extra data if present
+    extra_data = {
+        key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRS
+    }
+
+    # Only %-format when there are args; plain messages are used as-is
+    message = record.getMessage() if record.args else str(record.msg)
+
+    return record.levelname, record.name, message, extra_data
+
+
+def _queued_rows(item: tuple) -> tuple:
+    """
+    Resolve a queued write to its INSERT statement and parameter rows
+
+    Args:
+        item: (sql, rows) tuple, or (_LOG_RECORD, record) for a log record
+
+    Returns:
+        tuple: (sql, rows)
+    """
+    sql, rows = item
+    if sql is _LOG_RECORD:
+        level, module, message, extra_data = _record_fields(rows)
+        return INSERT_LOG_SQL, [(level, module, message, _to_json(extra_data))]
+    return sql, rows
+
+
+def _group_batch(batch: list) -> tuple:
+    """
+    Group a batch of queued items by INSERT statement
+
+    Args:
+        batch: Items taken from the write queue
+
+    Returns:
+        tuple: (mapping of INSERT statement to parameter rows, flush request
+        events found in the batch)
+    """
+    rows_by_statement = {}
+    flush_requests = []
+    for item in batch:
+        if item is _STOP_WRITER:
+            continue
+        if isinstance(item, threading.Event):
+            flush_requests.append(item)
+            continue
+        try:
+            sql, rows = _queued_rows(item)
+        except Exception as e:
+            print(f"Error converting log record: {e}")
+            continue
+        rows_by_statement.setdefault(sql, []).extend(rows)
+    return rows_by_statement, flush_requests
+
 
 class InMemoryDatabaseLogger:
     """
     In-memory SQLite database for storing logs and metrics
     Thread-safe implementation for concurrent access
+
+    Inserts are queued and committed in batches by a single writer thread, so
+    logging calls never wait on the database lock
     """
 
     def __init__(self, db_name="database/mlops_logs.db"):
@@ -27,10 +195,17 @@ class InMemoryDatabaseLogger:
         self.db_name = db_name
         self.connection = None
         self.lock = threading.Lock()
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer = None
         self.init_database()
 
     def init_database(self):
         """Initialize database tables"""
+        # The database file is not tracked, so its directory may not exist yet
+        db_dir = os.path.dirname(self.db_name)
+        if self.db_name != ":memory:" and db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
         with self.lock:
             self.connection = sqlite3.connect(
                 self.db_name,
@@ -38,6 +213,7 @@ class InMemoryDatabaseLogger:
                 isolation_level=None,  # Autocommit mode
             )
             self.connection.row_factory = sqlite3.Row  # Enable dict-like access
+            self._apply_pragmas()
 
             # Create logs table
             self.connection.execute(
@@ -90,6 +266,131 @@ class InMemoryDatabaseLogger:
 
             print("In-memory database initialized successfully")
 
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._process_writes, name="db-log-writer", daemon=True
+            )
+            self._writer.start()
+            _live_loggers.add(self)
+
+    def _apply_pragmas(self):
+        """Tune SQLite for a write-heavy logging workload"""
+        if self.db_name == ":memory:":
+            # Nothing to make durable, so skip fsyncs and keep the rollback
+            # journal in memory
+            pragmas = {"synchronous": "OFF", "journal_mode": "MEMORY"}
+        else:
+            # WAL lets readers (API, monitoring) run alongside the writer;
+            # NORMAL only fsyncs at checkpoints, which is safe under WAL
+            pragmas = {"journal_mode": "WAL", "synchronous": "NORMAL"}
+        pragmas.update({"temp_store": "MEMORY", "cache_size": "-2000"})
+
+        for name, value in pragmas.items():
+            self.connection.execute(f"PRAGMA {name}={value}")
+
+    def _process_writes(self):
+        """Writer thread loop: drain queued inserts and commit them in batches"""
+        while True:
+            batch = self._next_batch()
+            rows_by_statement, flush_requests = _group_batch(batch)
+
+            try:
+                self._write_rows(rows_by_statement)
+            except Exception as e:
+                # Don't let a failed write kill the writer thread
+                print(f"Error writing to database: {e}")
+            finally:
+                # Everything queued before a flush request has been written
+                for flush_request in flush_requests:
+                    flush_request.set()
+
+            if _STOP_WRITER in batch:
+                return
+
+    def _next_batch(self) -> list:
+        """
+        Wait for a queued item, then take up to WRITE_BATCH_SIZE items
+
+        Returns:
+            List of queued items in queue order
+        """
+        batch = [self._write_queue.get()]
+        while len(batch) < WRITE_BATCH_SIZE:
+            try:
+                batch.append(self._write_queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_rows(self, rows_by_statement: Dict[str, List[tuple]]):
+        """
+        Insert grouped rows in a single transaction
+
+        Args:
+            rows_by_statement: Mapping of INSERT statement to its parameter rows
+        """
+        if not rows_by_statement:
+            return
+
+        with self.lock:
+            try:
+                self.connection.execute("BEGIN")
+                for sql, rows in rows_by_statement.items():
+                    self.connection.executemany(sql, rows)
+                self.connection.execute("COMMIT")
+            except Exception:
+                # Any failure, including unbindable values, must end the
+                # transaction, or the next batch's BEGIN fails
+                if self.connection.in_transaction:
+                    self.connection.execute("ROLLBACK")
+            else:
+                return
+
+            # Retry row by row so one bad row doesn't drop the whole batch
+            for sql, rows in rows_by_statement.items():
+                for params in rows:
+                    try:
+                        self.connection.execute(sql, params)
+                    except Exception as e:
+                        print(f"Error writing to database: {e}")
+
+    def _enqueue_write(self, sql: str, params: tuple):
+        """
+        Queue an insert for the writer thread
+
+        Args:
+            sql: INSERT statement
+            params: Statement parameters
+        """
+        self._write_queue.put((sql, [params]))
+
+    def _enqueue_writes(self, sql: str, rows: List[tuple]):
+        """
+        Queue several inserts for the writer thread as one unit, so they are
+        committed in the same transaction
+
+        Args:
+            sql: INSERT statement
+            rows: Parameter rows
+        """
+        if rows:
+            self._write_queue.put((sql, rows))
+
+    def flush(self):
+        """
+        Block until the inserts queued before this call have been committed
+
+        Inserts queued by other threads while waiting are not waited for, so
+        flushing returns under steady logging traffic.
+        """
+        if self._writer is not None and self._writer.is_alive():
+            flush_request = threading.Event()
+            self._write_queue.put(flush_request)
+            # Stop waiting if the writer exits first, e.g. on close()
+            while not flush_request.wait(0.1):
+                if not self._writer.is_alive():
+                    return
+
     def log_message(
         self, level: str, module: str, message: str, extra_data: Optional[Dict] = None
     ):
@@ -102,15 +403,21 @@ class InMemoryDatabaseLogger:
             message: Log message
             extra_data: Additional data as dictionary
         """
-        with self.lock:
-            extra_json = json.dumps(extra_data) if extra_data else None
-            self.connection.execute(
-                """
-                INSERT INTO logs (level, module, message, extra_data)
-                VALUES (?, ?, ?, ?)
-            """,
-                (level, module, message, extra_json),
-            )
+        self._enqueue_write(
+            INSERT_LOG_SQL, (level, module, message, _to_json(extra_data))
+        )
+
+    def log_record(self, record: logging.LogRecord):
+        """
+        Store a log record in the database
+
+        The record is converted to a row on the writer thread, so the message
+        is %-formatted there; log arguments should not be mutated afterwards.
+
+        Args:
+            record: LogRecord instance
+        """
+        self._write_queue.put((_LOG_RECORD, record))
 
     def log_api_metric(
         self,
@@ -136,27 +443,43 @@ class InMemoryDatabaseLogger:
             request_data: Request data
             response_data: Response data
         """
-        with self.lock:
-            request_json = json.dumps(request_data) if request_data else None
-            response_json = json.dumps(response_data) if response_data else None
+        self._enqueue_write(
+            INSERT_API_METRIC_SQL,
+            (
+                endpoint,
+                method,
+                status_code,
+                response_time,
+                success,
+                error_message,
+                _to_json(request_data),
+                _to_json(response_data),
+            ),
+        )
 
-            self.connection.execute(
-                """
-                INSERT INTO api_metrics (endpoint, method, status_code, response_time, 
-                                       success, error_message, request_data, response_data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+    def log_api_metrics_bulk(self, metrics: List[Dict[str, Any]]):
+        """
+        Store several API metrics in a single transaction
+
+        Args:
+            metrics: Dictionaries with the keyword arguments of log_api_metric
+        """
+        self._enqueue_writes(
+            INSERT_API_METRIC_SQL,
+            [
                 (
-                    endpoint,
-                    method,
-                    status_code,
-                    response_time,
-                    success,
-                    error_message,
-                    request_json,
-                    response_json,
-                ),
-            )
+                    metric["endpoint"],
+                    metric["method"],
+                    metric["status_code"],
+                    metric["response_time"],
+                    metric["success"],
+                    metric.get("error_message"),
+                    _to_json(metric.get("request_data")),
+                    _to_json(metric.get("response_data")),
+                )
+                for metric in metrics
+            ],
+        )
 
     def log_model_metric(
         self,
@@ -180,25 +503,18 @@ class InMemoryDatabaseLogger:
             training_time: Training time in seconds
             parameters: Model parameters
         """
-        with self.lock:
-            params_json = json.dumps(parameters) if parameters else None
-
-            self.connection.execute(
-                """
-                INSERT INTO model_metrics (model_name, model_type, rmse, mae, 
-                                         r2_score, training_time, parameters)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    model_name,
-                    model_type,
-                    rmse,
-                    mae,
-                    r2_score,
-                    training_time,
-                    params_json,
-                ),
-            )
+        self._enqueue_write(
+            INSERT_MODEL_METRIC_SQL,
+            (
+                model_name,
+                model_type,
+                rmse,
+                mae,
+                r2_score,
+                training_time,
+                _to_json(parameters),
+            ),
+        )
 
     def get_logs(
         self,
@@ -217,6 +533,7 @@ class InMemoryDatabaseLogger:
         Returns:
             List of log records
         """
+        self.flush()
         with self.lock:
             query = "SELECT * FROM logs WHERE 1=1"
             params = []
@@ -251,6 +568,7 @@ class InMemoryDatabaseLogger:
         Returns:
             List of API metric records
         """
+        self.flush()
         with self.lock:
             query = "SELECT * FROM api_metrics WHERE 1=1"
             params = []
@@ -277,6 +595,7 @@ class InMemoryDatabaseLogger:
         Returns:
             List of model metric records
         """
+        self.flush()
         with self.lock:
             cursor = self.connection.execute(
                 """
@@ -297,56 +616,41 @@ class InMemoryDatabaseLogger:
         Returns:
             Dictionary with database statistics
         """
+        self.flush()
         with self.lock:
-            stats = {}
-
-            # Count logs by level
-            cursor = self.connection.execute(
-                """
-                SELECT level, COUNT(*) as count 
-                FROM logs 
-                GROUP BY level
-            """
-            )
-            stats["logs_by_level"] = {
-                row["level"]: row["count"] for row in cursor.fetchall()
-            }
-
-            # API metrics summary
+            # One statement gathers every summary so the lock is taken once
             cursor = self.connection.execute(
                 """
-                SELECT 
+                SELECT
+                    (SELECT json_group_object(level, count) FROM (
+                        SELECT level, COUNT(*) as count FROM logs GROUP BY level
+                    )) as logs_by_level,
                     COUNT(*) as total_requests,
                     AVG(response_time) as avg_response_time,
-                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_requests
+                    SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful_requests,
+                    (SELECT COUNT(*) FROM model_metrics) as total_model_metrics
                 FROM api_metrics
             """
             )
-            api_stats = cursor.fetchone()
-            if api_stats:
-                stats["api_metrics"] = {
-                    "total_requests": api_stats["total_requests"],
-                    "avg_response_time": api_stats["avg_response_time"],
-                    "successful_requests": api_stats["successful_requests"],
-                    "success_rate": (
-                        api_stats["successful_requests"]
-                        / api_stats["total_requests"]
-                        * 100
-                    )
-                    if api_stats["total_requests"] > 0
-                    else 0,
-                }
-
-            # Model metrics count
-            cursor = self.connection.execute(
-                "SELECT COUNT(*) as count FROM model_metrics"
-            )
-            stats["total_model_metrics"] = cursor.fetchone()["count"]
-
-            return stats
+            row = cursor.fetchone()
+
+        total_requests = row["total_requests"]
+        return {
+            "logs_by_level": json.loads(row["logs_by_level"]),
+            "api_metrics": {
+                "total_requests": total_requests,
+                "avg_response_time": row["avg_response_time"],
+                "successful_requests": row["successful_requests"],
+                "success_rate": (row["successful_requests"] / total_requests * 100)
+                if total_requests > 0
+                else 0,
+            },
+            "total_model_metrics": row["total_model_metrics"],
+        }
 
     def clear_database(self):
         """Clear all data from database (useful for testing)"""
+        self.flush()
         with self.lock:
             self.connection.execute("DELETE FROM logs")
             self.connection.execute("DELETE FROM api_metrics")
@@ -354,9 +658,15 @@ class InMemoryDatabaseLogger:
             print("Database cleared")
 
     def close(self):
-        """Close database connection"""
+        """Commit queued writes, stop the writer thread and close the connection"""
+        _live_loggers.discard(self)
+        if self._writer is not None and self._writer.is_alive():
+            self._write_queue.put(_STOP_WRITER)
+            self._writer.join()
+
         if self.connection:
             self.connection.close()
+            self.connection = None
             print("Database connection closed")
 
 
@@ -377,45 +687,34 @@ class DatabaseLogHandler(logging.Handler):
             record: LogRecord instance
         """
         try:
-            # Extract extra data if present
-            extra_data = {}
-            for key, value in record.__dict__.items():
-                if key not in [
-                    "name",
-                    "msg",
-                    "args",
-                    "levelname",
-                    "levelno",
-                    "pathname",
-                    "filename",
-                    "module",
-                    "lineno",
-                    "funcName",
-                    "created",
-                    "msecs",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "processName",
-                    "process",
-                    "message",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                ]:
-                    extra_data[key] = value
-
-            self.db_logger.log_message(
-                level=record.levelname,
-                module=record.name,
-                message=record.getMessage(),
-                extra_data=extra_data if extra_data else None,
-            )
+            self.db_logger.log_message(*_record_fields(record))
         except Exception as e:
             # Don't let logging errors crash the application
             print(f"Error in DatabaseLogHandler: {e}")
 
 
+class AsyncDBHandler(DatabaseLogHandler):
+    """
+    Logging handler that hands records straight to the database writer thread
+
+    Extracting extra data, formatting the message and serializing it all
+    happen on the writer thread, so logging calls only pay for a queue put.
+    """
+
+    def emit(self, record):
+        """
+        Queue a log record for the database writer thread
+
+        Args:
+            record: LogRecord instance
+        """
+        try:
+            self.db_logger.log_record(record)
+        except Exception as e:
+            # Don't let logging errors crash the application
+            print(f"Error in AsyncDBHandler: {e}")
+
+
 # Global database logger instance
 db_logger = InMemoryDatabaseLogger()
 
@@ -455,7 +754,7 @@ def setup_database_logging(logger_name: Optional[str] = None) -> logging.Logger:
     logger.addHandler(console_handler)
 
     # Database handler
-    db_handler = DatabaseLogHandler(db_logger)
+    db_handler = AsyncDBHandler(db_logger)
     db_handler.setLevel(logging.INFO)
     logger.addHandler(db_handler)
 
@@ -478,15 +777,25 @@ if __name__ == "__main__":
     logger.error("Test error message")
 
     # Test API metrics
-    db_logger.log_api_metric(
-        endpoint="/predict",
-        method="POST",
-        status_code=200,
-        response_time=0.123,
-        success=True,
-        request_data={"test": "data"},
-        response_data={"prediction": 1.23},
-    )
+    api_metrics = [
+        {
+            "endpoint": "/predict",
+            "method": "POST",
+            "status_code": 200,
+            "response_time": 0.123,
+            "success": True,
+            "request_data": {"test": "data"},
+            "response_data": {"prediction": 1.23},
+        },
+        {
+            "endpoint": "/health",
+            "method": "GET",
+            "status_code": 200,
+            "response_time": 0.004,
+            "success": True,
+        },
+    ]
+    db_logger.log_api_metrics_bulk(api_metrics)
 
     # Test model metrics
     db_logger.log_model_metric(
@@ -2,27 +2,143 @@
 Model training module with MLflow tracking for California Housing dataset
 """
 
+import hashlib
+import json
 import logging
 import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 
 import joblib
 import mlflow
 import mlflow.sklearn
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor, RandomForestRegressor
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+import sklearn
+from joblib import Parallel, delayed
+from mlflow.tracking import MlflowClient
+from sklearn import ensemble, linear_model
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
 
 from data_preprocessing import load_processed_data
 from data_preprocessing import main as preprocess_main
 
+# Intel's oneDAL-accelerated estimators, enabled with USE_SKLEARNEX=true.
+# Set SKLEARNEX_VERBOSE=INFO to log which calls are accelerated
+try:
+    from sklearnex import patch_sklearn, unpatch_sklearn
+except ImportError:
+    patch_sklearn = None
+
+# orjson is a faster drop-in encoder; fall back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Also export models to ONNX when skl2onnx is installed
+try:
+    import mlflow.onnx
+    from skl2onnx import to_onnx
+except ImportError:
+    to_onnx = None
+
+# blake3 hashes large buffers faster than hashlib; blake2b is the fallback
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.blake2b
+
+# Compress saved models with lz4 when it is installed: much faster than
+# joblib's zlib and several times smaller than a raw pickle
+try:
+    import lz4  # noqa: F401
+
+    MODEL_COMPRESSION = ("lz4", 3)
+except ImportError:
+    MODEL_COMPRESSION = 0
+
+# Compile the metrics kernel with Numba when it is installed
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # Set up logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-)
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Tracking store used when MLFLOW_TRACKING_URI is not set: one SQLite file
+# instead of the file store's many small per-param and per-metric files
+DEFAULT_TRACKING_URI = "sqlite:///mlruns/mlflow.db"
+
+# Artifact root for experiments created in the default store, kept out of the
+# tracked legacy file store in mlruns/
+DEFAULT_ARTIFACT_ROOT = "mlartifacts"
+
+EXPERIMENT_NAME = "California_Housing_Regression"
+
+# Previously trained forest that RF_WARM_START grows instead of refitting
+RF_WARM_START_PATH = os.path.join("models", "random_forest_model.pkl")
+
+# Largest forest RF_WARM_START may grow; beyond it the forest is refitted
+RF_WARM_START_MAX_TREES = 500
+
+# Optional on-disk cache of fitted estimators, keyed by training data and
+# parameters; disabled unless MODEL_CACHE_DIR is set
+MODEL_CACHE_DIR = os.environ.get("MODEL_CACHE_DIR")
+
+# Number of most recently used fitted estimators kept in the cache
+MODEL_CACHE_MAX_ENTRIES = 16
+
+
+def _error_sums_numpy(y_true, y_pred):
+    """
+    Accumulate the sums behind RMSE, MAE and R2 with NumPy
+
+    The target is shifted by its first value so the one-pass sum of squares
+    stays numerically stable.
+
+    Args:
+        y_true: Contiguous float64 array of true target values
+        y_pred: Contiguous float64 array of predicted values
+
+    Returns:
+        tuple: (squared error, absolute error, shifted target, shifted target squared) sums
+    """
+    d = y_true - y_pred
+    t = y_true - y_true[0]
+    return d @ d, np.abs(d).sum(), t.sum(), t @ t
+
+
+def _error_sums_loop(y_true, y_pred):
+    """
+    Single-pass loop version of _error_sums_numpy, compiled with Numba
+    """
+    shift = y_true[0]
+    sse = 0.0
+    sae = 0.0
+    sy = 0.0
+    syy = 0.0
+    for i in range(y_true.shape[0]):
+        d = y_true[i] - y_pred[i]
+        sse += d * d
+        sae += abs(d)
+        t = y_true[i] - shift
+        sy += t
+        syy += t * t
+    return sse, sae, sy, syy
+
+
+# A serial loop without fastmath keeps the sums in order, so the metrics do
+# not depend on the thread count
+if njit is not None:
+    _error_sums = njit(parallel=False, fastmath=False, cache=True)(_error_sums_loop)
+else:
+    _error_sums = _error_sums_numpy
+
 
 def evaluate_model(y_true, y_pred):
     """
@@ -35,43 +151,305 @@ def evaluate_model(y_true, y_pred):
     Returns:
         dict: Dictionary of evaluation metrics
     """
+    y_true = np.ascontiguousarray(y_true, dtype=np.float64).ravel()
+    y_pred = np.ascontiguousarray(y_pred, dtype=np.float64).ravel()
+    n = y_true.shape[0]
+    if n == 0:
+        raise ValueError("Cannot evaluate a model on empty targets")
+    if y_pred.shape[0] != n:
+        raise ValueError(
+            f"y_true and y_pred have different lengths: {n} != {y_pred.shape[0]}"
+        )
+    if not (np.isfinite(y_true).all() and np.isfinite(y_pred).all()):
+        raise ValueError("y_true and y_pred must not contain NaN or infinity")
+    sse, sae, sy, syy = _error_sums(y_true, y_pred)
+
+    ss_tot = syy - sy * sy / n
+    if ss_tot > 0:
+        r2 = 1.0 - sse / ss_tot
+    else:
+        # Constant target, scored the same way as scikit-learn's r2_score
+        r2 = 1.0 if sse == 0 else 0.0
+
+    # Cast to Python floats so the metrics stay JSON-serializable
     metrics = {
-        "rmse": np.sqrt(mean_squared_error(y_true, y_pred)),
-        "mae": mean_absolute_error(y_true, y_pred),
-        "r2": r2_score(y_true, y_pred),
+        "rmse": float(np.sqrt(sse / n)),
+        "mae": float(sae / n),
+        "r2": float(r2),
     }
     return metrics
 
 
-def train_linear_regression(X_train, y_train, X_test, y_test):
+def _fit_cache_key(model, X, y):
+    """
+    Build a content hash identifying a fit of model on (X, y)
+
+    Args:
+        model: Unfitted scikit-learn estimator
+        X: Training features
+        y: Training target
+
+    Returns:
+        str: Hex digest over the estimator class and parameters, the
+        scikit-learn version, and the training data
+    """
+    hasher = _hasher()
+    spec = {
+        "estimator": f"{type(model).__module__}.{type(model).__qualname__}",
+        "params": model.get_params(),
+        "sklearn_version": sklearn.__version__,
+        "columns": list(getattr(X, "columns", [])),
+    }
+    hasher.update(json.dumps(spec, sort_keys=True, default=str).encode())
+    _hash_arrays(hasher, X, y)
+    return hasher.hexdigest()[:32]
+
+
+def _hash_arrays(hasher, *arrays):
+    """
+    Feed the dtype, shape and contents of each array to a hasher
+
+    Args:
+        hasher: hashlib-style hasher to update
+        *arrays: Array-likes to hash
+    """
+    for data in arrays:
+        array = np.ascontiguousarray(data)
+        hasher.update(f"{array.dtype}{array.shape}".encode())
+        hasher.update(memoryview(array).cast("B"))
+
+
+def _split_fingerprint(X_test, y_test):
+    """
+    Build a content hash identifying a train/test split by its test rows
+
+    Args:
+        X_test: Test features
+        y_test: Test target
+
+    Returns:
+        str: Hex digest over the test data
+    """
+    hasher = _hasher()
+    _hash_arrays(hasher, X_test, y_test)
+    return hasher.hexdigest()[:32]
+
+
+def _prune_fit_cache(cache_dir, max_entries=MODEL_CACHE_MAX_ENTRIES):
+    """
+    Remove all but the most recently used fitted estimators from the cache
+
+    Args:
+        cache_dir: Directory holding cached fitted estimators
+        max_entries: Number of estimators to keep
+    """
+    entries = sorted(
+        (entry for entry in os.scandir(cache_dir) if entry.name.endswith(".pkl")),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True,
+    )
+    for entry in entries[max_entries:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def cached_fit(model, X, y, cache_dir=None):
+    """
+    Fit model, reusing a previously fitted copy for identical data and params
+
+    Args:
+        model: Unfitted scikit-learn estimator
+        X: Training features
+        y: Training target
+        cache_dir: Directory holding cached fitted estimators; defaults to
+            MODEL_CACHE_DIR, and the cache is skipped when neither is set
+
+    Returns:
+        Fitted estimator
+    """
+    if cache_dir is None:
+        cache_dir = MODEL_CACHE_DIR
+    if not cache_dir:
+        return model.fit(X, y)
+
+    cache_path = os.path.join(cache_dir, f"{_fit_cache_key(model, X, y)}.pkl")
+    if os.path.exists(cache_path):
+        logger.info(f"Reusing cached {type(model).__name__} from {cache_path}")
+        # Mark the entry as recently used so pruning keeps it
+        os.utime(cache_path)
+        return joblib.load(cache_path)
+
+    model.fit(X, y)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # Write to a temporary file and rename it into place, so concurrent fits
+    # and interrupted writes never leave a partial entry behind
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    try:
+        joblib.dump(model, tmp_path, compress=MODEL_COMPRESSION, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    _prune_fit_cache(cache_dir)
+    return model
+
+
+def _write_json(data, path):
+    """
+    Write data to a JSON file with two-space indentation
+
+    Args:
+        data: JSON-serializable object
+        path: Output file path
+    """
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=options))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+
+
+def _upload_artifacts(run_id, local_dir):
+    """
+    Upload the contents of a local directory as run artifacts, then remove it
+
+    Args:
+        run_id: ID of the run to attach the artifacts to
+        local_dir: Temporary directory to upload
+    """
+    try:
+        MlflowClient().log_artifacts(run_id, local_dir)
+    finally:
+        shutil.rmtree(local_dir, ignore_errors=True)
+
+
+def _log_model(model, X_sample, deferred_artifacts=None, artifact_path="model"):
+    """
+    Save a model in MLflow format locally and upload it to the active run
+
+    When skl2onnx is available an ONNX export is logged alongside it as
+    onnx_model, for serving with onnxruntime.
+
+    Args:
+        model: Fitted scikit-learn model
+        X_sample: Example input rows, used to infer the ONNX input signature
+        deferred_artifacts: List to append the (run_id, local_dir) pair to
+            instead of uploading, for the caller to upload later; uploads
+            synchronously when None
+        artifact_path: Destination path within the active run's artifacts
+    """
+    run_id = mlflow.active_run().info.run_id
+
+    # save_model refuses to write into an existing directory, so save into
+    # fresh subdirectories of a temporary directory uploaded as a whole
+    tmp_dir = tempfile.mkdtemp(prefix="mlflow-model-")
+    mlflow.sklearn.save_model(model, os.path.join(tmp_dir, artifact_path))
+
+    if to_onnx is not None:
+        try:
+            onnx_model = to_onnx(model, np.asarray(X_sample, dtype=np.float32))
+            mlflow.onnx.save_model(onnx_model, os.path.join(tmp_dir, "onnx_model"))
+        except Exception as e:
+            logger.warning(f"Skipping ONNX export of {type(model).__name__}: {e}")
+
+    if deferred_artifacts is None:
+        _upload_artifacts(run_id, tmp_dir)
+    else:
+        deferred_artifacts.append((run_id, tmp_dir))
+
+
+def wait_for_artifact_uploads(futures):
+    """
+    Block until the given artifact uploads have finished
+
+    Upload failures are logged rather than raised, so a failed upload does
+    not discard models that have already been trained.
+
+    Args:
+        futures: Futures of _upload_artifacts calls
+    """
+    for future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            logger.warning(f"Failed to upload model artifacts: {e}")
+
+
+def _start_run(run_name, parent_run_id=None, experiment_id=None):
+    """
+    Start an MLflow run, nested under a parent run when one is given
+
+    Args:
+        run_name: Name of the run
+        parent_run_id: ID of the parent run, passed explicitly because worker
+            processes do not share the parent's active run
+        experiment_id: Experiment of the parent run
+
+    Returns:
+        ActiveRun context manager
+    """
+    if parent_run_id is None:
+        return mlflow.start_run(run_name=run_name)
+    return mlflow.start_run(
+        run_name=run_name,
+        experiment_id=experiment_id,
+        nested=True,
+        parent_run_id=parent_run_id,
+    )
+
+
+def train_linear_regression(
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    parent_run_id=None,
+    experiment_id=None,
+    deferred_artifacts=None,
+):
     """
     Train Linear Regression model
+
+    The least-squares solve runs in float64, since single precision can lose
+    accuracy on ill-conditioned design matrices.
     """
     logger.info("Training Linear Regression model...")
 
-    with mlflow.start_run(run_name="Linear_Regression"):
+    with _start_run("Linear_Regression", parent_run_id, experiment_id):
         # Train model
-        model = LinearRegression()
-        model.fit(X_train, y_train)
+        model = cached_fit(
+            linear_model.LinearRegression(),
+            X_train.astype(np.float64),
+            y_train.astype(np.float64),
+        )
 
         # Make predictions
-        y_pred = model.predict(X_test)
+        y_pred = model.predict(X_test.astype(np.float64))
 
         # Evaluate model
         metrics = evaluate_model(y_test, y_pred)
 
         # Log parameters
-        mlflow.log_param("model_type", "Linear Regression")
-        mlflow.log_param("n_features", X_train.shape[1])
+        mlflow.log_params(
+            {
+                "model_type": "Linear Regression",
+                "n_features": X_train.shape[1],
+            }
+        )
 
         # Log metrics
-        mlflow.log_metric("rmse", metrics["rmse"])
-        mlflow.log_metric("mae", metrics["mae"])
-        mlflow.log_metric("r2", metrics["r2"])
+        mlflow.log_metrics(metrics)
 
         # Log model (skip in CI environment due to path issues)
         if not os.getenv("GITHUB_ACTIONS"):
-            mlflow.sklearn.log_model(model, "model")
+            _log_model(model, X_train.iloc[:1], deferred_artifacts)
         else:
             logger.info("Skipping model logging in GitHub Actions environment")
 
@@ -83,20 +461,122 @@ def train_linear_regression(X_train, y_train, X_test, y_test):
         return model, metrics
 
 
+def _load_warm_start_forest(
+    path, n_features, max_depth, random_state, split_fingerprint, increment
+):
+    """
+    Load a previously trained forest that can be grown with more trees
+
+    A forest fitted against a different train/test split is refused, since
+    its trees may have been trained on rows that are now in the test split.
+
+    Args:
+        path: Path of the saved forest
+        n_features: Number of features in the new training data
+        max_depth: Maximum tree depth the new trees will use
+        random_state: Random seed the new trees will use
+        split_fingerprint: _split_fingerprint of the current test split
+        increment: Number of trees to add
+
+    Returns:
+        RandomForestRegressor, or None if there is no compatible saved forest
+    """
+    if not os.path.exists(path):
+        logger.info(f"No previous forest at {path}; training from scratch")
+        return None
+
+    model = joblib.load(path)
+    compatible = (
+        isinstance(model, RandomForestRegressor)
+        and model.n_features_in_ == n_features
+        and model.max_depth == max_depth
+        and model.random_state == random_state
+    )
+    if not compatible:
+        logger.info(f"Previous forest at {path} does not match; training from scratch")
+        return None
+
+    if getattr(model, "split_fingerprint_", None) != split_fingerprint:
+        logger.warning(
+            f"Previous forest at {path} was fitted against a different "
+            "train/test split; training from scratch"
+        )
+        return None
+
+    if model.n_estimators + increment > RF_WARM_START_MAX_TREES:
+        logger.warning(
+            f"Growing the forest at {path} past {RF_WARM_START_MAX_TREES} trees "
+            "is not allowed; training from scratch"
+        )
+        return None
+
+    return model
+
+
 def train_random_forest(
-    X_train, y_train, X_test, y_test, n_estimators=100, max_depth=10, random_state=42
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    n_estimators=100,
+    max_depth=10,
+    random_state=42,
+    n_jobs=-1,
+    warm_start_increment=0,
+    parent_run_id=None,
+    experiment_id=None,
+    deferred_artifacts=None,
 ):
     """
     Train Random Forest model
+
+    Trees are built (and predictions made) in parallel over n_jobs cores;
+    -1 uses all of them. With a positive warm_start_increment, a compatible
+    forest saved by a previous run against the same train/test split is
+    grown by that many trees fitted on the new data, up to
+    RF_WARM_START_MAX_TREES, instead of training n_estimators trees from
+    scratch.
     """
     logger.info("Training Random Forest model...")
 
-    with mlflow.start_run(run_name="Random_Forest"):
+    with _start_run("Random_Forest", parent_run_id, experiment_id):
+        split_fingerprint = _split_fingerprint(X_test, y_test)
+        previous_model = None
+        if warm_start_increment > 0:
+            previous_model = _load_warm_start_forest(
+                RF_WARM_START_PATH,
+                X_train.shape[1],
+                max_depth,
+                random_state,
+                split_fingerprint,
+                warm_start_increment,
+            )
+
         # Train model
-        model = RandomForestRegressor(
-            n_estimators=n_estimators, max_depth=max_depth, random_state=random_state
-        )
-        model.fit(X_train, y_train)
+        if previous_model is not None:
+            previous_n_estimators = previous_model.n_estimators
+            model = previous_model.set_params(
+                n_estimators=previous_n_estimators + warm_start_increment,
+                warm_start=True,
+                n_jobs=n_jobs,
+            )
+            model.fit(X_train, y_train)
+            n_estimators = model.n_estimators
+            logger.info(
+                f"Warm-started forest: {previous_n_estimators} -> "
+                f"{n_estimators} trees"
+            )
+        else:
+            model = ensemble.RandomForestRegressor(
+                n_estimators=n_estimators,
+                max_depth=max_depth,
+                random_state=random_state,
+                n_jobs=n_jobs,
+            )
+            model = cached_fit(model, X_train, y_train)
+
+        # Record the split so a later warm start can check it matches
+        model.split_fingerprint_ = split_fingerprint
 
         # Make predictions
         y_pred = model.predict(X_test)
@@ -105,20 +585,25 @@ def train_random_forest(
         metrics = evaluate_model(y_test, y_pred)
 
         # Log parameters
-        mlflow.log_param("model_type", "Random Forest")
-        mlflow.log_param("n_estimators", n_estimators)
-        mlflow.log_param("max_depth", max_depth)
-        mlflow.log_param("random_state", random_state)
-        mlflow.log_param("n_features", X_train.shape[1])
+        params = {
+            "model_type": "Random Forest",
+            "n_estimators": n_estimators,
+            "max_depth": max_depth,
+            "random_state": random_state,
+            "n_jobs": n_jobs,
+            "n_features": X_train.shape[1],
+            "warm_started": previous_model is not None,
+        }
+        if previous_model is not None:
+            params["previous_n_estimators"] = previous_n_estimators
+        mlflow.log_params(params)
 
         # Log metrics
-        mlflow.log_metric("rmse", metrics["rmse"])
-        mlflow.log_metric("mae", metrics["mae"])
-        mlflow.log_metric("r2", metrics["r2"])
+        mlflow.log_metrics(metrics)
 
         # Log model (skip in CI environment due to path issues)
         if not os.getenv("GITHUB_ACTIONS"):
-            mlflow.sklearn.log_model(model, "model")
+            _log_model(model, X_train.iloc[:1], deferred_artifacts)
         else:
             logger.info("Skipping model logging in GitHub Actions environment")
 
@@ -139,21 +624,27 @@ def train_gradient_boosting(
     learning_rate=0.1,
     max_depth=3,
     random_state=42,
+    parent_run_id=None,
+    experiment_id=None,
+    deferred_artifacts=None,
 ):
     """
     Train Gradient Boosting model
+
+    Uses the histogram-based HistGradientBoostingRegressor, which bins the
+    features and builds each tree in parallel; n_estimators maps to max_iter.
     """
     logger.info("Training Gradient Boosting model...")
 
-    with mlflow.start_run(run_name="Gradient_Boosting"):
+    with _start_run("Gradient_Boosting", parent_run_id, experiment_id):
         # Train model
-        model = GradientBoostingRegressor(
-            n_estimators=n_estimators,
+        model = HistGradientBoostingRegressor(
+            max_iter=n_estimators,
             learning_rate=learning_rate,
             max_depth=max_depth,
             random_state=random_state,
         )
-        model.fit(X_train, y_train)
+        model = cached_fit(model, X_train, y_train)
 
         # Make predictions
         y_pred = model.predict(X_test)
@@ -162,21 +653,24 @@ def train_gradient_boosting(
         metrics = evaluate_model(y_test, y_pred)
 
         # Log parameters
-        mlflow.log_param("model_type", "Gradient Boosting")
-        mlflow.log_param("n_estimators", n_estimators)
-        mlflow.log_param("learning_rate", learning_rate)
-        mlflow.log_param("max_depth", max_depth)
-        mlflow.log_param("random_state", random_state)
-        mlflow.log_param("n_features", X_train.shape[1])
+        mlflow.log_params(
+            {
+                "model_type": "Gradient Boosting",
+                "estimator": "HistGradientBoostingRegressor",
+                "n_estimators": n_estimators,
+                "learning_rate": learning_rate,
+                "max_depth": max_depth,
+                "random_state": random_state,
+                "n_features": X_train.shape[1],
+            }
+        )
 
         # Log metrics
-        mlflow.log_metric("rmse", metrics["rmse"])
-        mlflow.log_metric("mae", metrics["mae"])
-        mlflow.log_metric("r2", metrics["r2"])
+        mlflow.log_metrics(metrics)
 
         # Log model (skip in CI environment due to path issues)
         if not os.getenv("GITHUB_ACTIONS"):
-            mlflow.sklearn.log_model(model, "model")
+            _log_model(model, X_train.iloc[:1], deferred_artifacts)
         else:
             logger.info("Skipping model logging in GitHub Actions environment")
 
@@ -188,6 +682,45 @@ def train_gradient_boosting(
         return model, metrics
 
 
+def _run_training_task(train_func, tracking_uri, *args, use_sklearnex=False, **kwargs):
+    """
+    Run a train_* function inside a joblib worker process
+
+    Args:
+        train_func: Training function to call
+        tracking_uri: MLflow tracking URI of the parent process
+        *args, **kwargs: Arguments forwarded to train_func
+        use_sklearnex: Train with scikit-learn-intelex's accelerated
+            estimators, which are then also needed to load the saved model
+
+    Returns:
+        tuple: (model, metrics) returned by train_func, and the (run_id,
+        local_dir) model artifacts it saved for the parent to upload
+    """
+    # Workers running functions pickled from __main__ skip the module-level
+    # logging setup, so configure it here (a no-op if already configured)
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    mlflow.set_tracking_uri(tracking_uri)
+
+    # Save the model artifacts locally and hand them back, so the parent
+    # uploads them while it saves the best model
+    artifacts = []
+    kwargs["deferred_artifacts"] = artifacts
+
+    if not use_sklearnex:
+        model, metrics = train_func(*args, **kwargs)
+    else:
+        # Loky workers are fresh interpreters, so the patch is applied here
+        # rather than inherited from main()
+        patch_sklearn()
+        try:
+            model, metrics = train_func(*args, **kwargs)
+        finally:
+            unpatch_sklearn()
+
+    return model, metrics, artifacts
+
+
 def save_best_model(models_results, models_dir="models"):
     """
     Save the best performing model based on RMSE and generate comprehensive model comparison
@@ -220,15 +753,14 @@ def save_best_model(models_results, models_dir="models"):
         individual_model_path = os.path.join(
             models_dir, f"{model_name.lower()}_model.pkl"
         )
-        joblib.dump(model, individual_model_path)
+        joblib.dump(
+            model, individual_model_path, compress=MODEL_COMPRESSION, protocol=5
+        )
         logger.info(f"Saved {model_name} to {individual_model_path}")
 
     # Save all models comparison data
     comparison_path = os.path.join(models_dir, "all_models_comparison.json")
-    with open(comparison_path, "w") as f:
-        import json
-
-        json.dump(all_models_metrics, f, indent=2)
+    _write_json(all_models_metrics, comparison_path)
     logger.info(f"All models comparison saved to {comparison_path}")
 
     # Find best model based on RMSE
@@ -237,22 +769,19 @@ def save_best_model(models_results, models_dir="models"):
 
     # Save best model
     model_path = os.path.join(models_dir, "best_model.pkl")
-    joblib.dump(best_model, model_path)
+    joblib.dump(best_model, model_path, compress=MODEL_COMPRESSION, protocol=5)
 
     # Enhanced best model metrics with additional info
     enhanced_best_metrics = {
         **best_metrics,
         "best_model_name": best_model_name,
         "best_model_type": type(best_model).__name__,
-        "training_timestamp": pd.Timestamp.now().isoformat(),
+        "training_timestamp": datetime.now(timezone.utc).isoformat(),
     }
 
     # Save enhanced metrics
     metrics_path = os.path.join(models_dir, "best_model_metrics.json")
-    with open(metrics_path, "w") as f:
-        import json
-
-        json.dump(enhanced_best_metrics, f, indent=2)
+    _write_json(enhanced_best_metrics, metrics_path)
 
     logger.info(f"Best model ({best_model_name}) saved to {model_path}")
     logger.info(
@@ -288,32 +817,96 @@ def main():
     # Load processed data
     X_train, X_test, y_train, y_test, scaler = load_processed_data()
 
-    # Configure MLflow for CI environment
-    tracking_uri = os.getenv("MLFLOW_TRACKING_URI")
-    if tracking_uri:
-        mlflow.set_tracking_uri(tracking_uri)
-        logger.info(f"MLflow tracking URI set to: {tracking_uri}")
-
-    # Set MLflow experiment
-    mlflow.set_experiment("California_Housing_Regression")
-
-    # Train multiple models
-    models_results = []
-
-    # Linear Regression
-    lr_model, lr_metrics = train_linear_regression(X_train, y_train, X_test, y_test)
-    models_results.append((lr_model, lr_metrics))
-
-    # Random Forest
-    rf_model, rf_metrics = train_random_forest(X_train, y_train, X_test, y_test)
-    models_results.append((rf_model, rf_metrics))
+    # The tree models work in float32 internally, so hand them float32 data
+    # rather than letting each fit make its own converted copy
+    X_train = X_train.astype(np.float32, copy=False)
+    X_test = X_test.astype(np.float32, copy=False)
+    y_train = y_train.astype(np.float32, copy=False)
+    y_test = y_test.astype(np.float32, copy=False)
 
-    # Gradient Boosting
-    gb_model, gb_metrics = train_gradient_boosting(X_train, y_train, X_test, y_test)
-    models_results.append((gb_model, gb_metrics))
-
-    # Save best model
-    best_model, best_metrics = save_best_model(models_results)
+    # Configure MLflow, defaulting to the local SQLite store
+    tracking_uri = os.getenv("MLFLOW_TRACKING_URI")
+    artifact_location = None
+    if not tracking_uri:
+        os.makedirs("mlruns", exist_ok=True)
+        tracking_uri = DEFAULT_TRACKING_URI
+        artifact_location = os.path.abspath(DEFAULT_ARTIFACT_ROOT)
+    mlflow.set_tracking_uri(tracking_uri)
+    logger.info(f"MLflow tracking URI set to: {tracking_uri}")
+
+    # Runs are logged explicitly; keep the sklearn autologger from adding
+    # duplicate runs
+    mlflow.sklearn.autolog(disable=True)
+
+    # Set MLflow experiment; a tracking server's own artifact root is used
+    # when MLFLOW_TRACKING_URI is set
+    if mlflow.get_experiment_by_name(EXPERIMENT_NAME) is None:
+        mlflow.create_experiment(EXPERIMENT_NAME, artifact_location=artifact_location)
+    mlflow.set_experiment(EXPERIMENT_NAME)
+
+    # Train the independent models concurrently, each in its own process and
+    # logged as a nested run under one parent run
+    tracking_uri = mlflow.get_tracking_uri()
+
+    # Share the cores between the concurrent fits so the forest's own tree
+    # parallelism does not oversubscribe the machine
+    rf_n_jobs = max(1, (os.cpu_count() or 1) // 3)
+
+    # RF_WARM_START=<k> grows the previously saved forest by k trees instead
+    # of refitting it
+    rf_warm_start = int(os.getenv("RF_WARM_START", "0"))
+
+    # USE_SKLEARNEX=true trains with Intel's accelerated estimators. They are
+    # saved as they are, so scikit-learn-intelex is then a runtime dependency
+    # of the API as well
+    use_sklearnex = os.getenv("USE_SKLEARNEX", "").lower() == "true"
+    if use_sklearnex and patch_sklearn is None:
+        logger.warning("USE_SKLEARNEX is set but scikit-learn-intelex is not installed")
+        use_sklearnex = False
+
+    train_tasks = [
+        (train_linear_regression, {}),
+        (
+            train_random_forest,
+            {"n_jobs": rf_n_jobs, "warm_start_increment": rf_warm_start},
+        ),
+        (train_gradient_boosting, {}),
+    ]
+
+    with mlflow.start_run(run_name="Training_Pipeline") as parent_run:
+        run_context = {
+            "parent_run_id": parent_run.info.run_id,
+            "experiment_id": parent_run.info.experiment_id,
+        }
+        tasks = [
+            delayed(_run_training_task)(
+                train_func,
+                tracking_uri,
+                X_train,
+                y_train,
+                X_test,
+                y_test,
+                use_sklearnex=use_sklearnex,
+                **train_kwargs,
+                **run_context,
+            )
+            for train_func, train_kwargs in train_tasks
+        ]
+        task_results = Parallel(n_jobs=len(tasks), backend="loky")(tasks)
+
+    models_results = [(model, metrics) for model, metrics, _ in task_results]
+
+    # Upload the workers' model artifacts while the best model is saved
+    with ThreadPoolExecutor(
+        max_workers=2, thread_name_prefix="mlflow-artifacts"
+    ) as executor:
+        uploads = [
+            executor.submit(_upload_artifacts, run_id, local_dir)
+            for _, _, artifacts in task_results
+            for run_id, local_dir in artifacts
+        ]
+        best_model, best_metrics = save_best_model(models_results)
+        wait_for_artifact_uploads(uploads)
 
     logger.info("Model training pipeline completed successfully!")
 
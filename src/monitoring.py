@@ -7,16 +7,64 @@ import json
 import logging
 import os
 import time
-from datetime import datetime
-from typing import Any, Dict
+from collections import deque
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Optional, Union
 
-import matplotlib.pyplot as plt
+import matplotlib
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
 # Import our database logging system
 from database_logging import get_database_logger, setup_database_logging
 
+# Reports are only written to files; selecting the non-interactive backend up
+# front skips the GUI backend probe on first use
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+# Columns and dtypes of the health check records used for reporting, so the
+# report DataFrame is built with typed columns instead of inferring them
+METRIC_COLUMNS = ["timestamp", "status_code", "response_time", "is_healthy", "error"]
+METRIC_DTYPES = {
+    "status_code": "Int16",
+    "response_time": "float64",
+    "is_healthy": "boolean",
+}
+
+# Number of most recent health check records kept in memory for reporting
+MAX_METRICS = 10000
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _optional_float(value) -> Optional[float]:
+    """
+    Convert a pandas aggregate to a JSON-friendly float
+
+    Args:
+        value: Scalar result of a reduction, possibly missing
+
+    Returns:
+        The value as a float, or None if it is missing
+    """
+    return None if pd.isna(value) else float(value)
+
+
+def _optional_value(value):
+    """
+    Convert a missing pandas aggregate to None so it is written as JSON null
+
+    Args:
+        value: Scalar result of a reduction, possibly missing
+
+    Returns:
+        The value unchanged, or None if it is missing
+    """
+    return None if pd.isna(value) else value
+
 
 # Set up logging configuration
 def setup_logging(log_level=logging.INFO, log_file="logs/mlops_pipeline.log"):
@@ -54,7 +102,27 @@ class APIMonitor:
         self.api_url = api_url
         self.logger = setup_database_logging("api_monitor")  # Use database logging
         self.db_logger = get_database_logger()  # Get database logger instance
-        self.metrics = []
+
+        # Reuse connections across checks so handshakes don't inflate the
+        # response times being measured
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.metrics = deque(maxlen=MAX_METRICS)
+        self._metrics_recorded = 0  # Total records ever appended
+        self._metrics_saved = 0  # High-water mark of records written to file
+
+    def _record_metric(self, data: Dict[str, Any]):
+        """
+        Append a health check record to the bounded metrics buffer
+
+        Args:
+            data: Health check record
+        """
+        self.metrics.append(data)
+        self._metrics_recorded += 1
 
     def health_check(self) -> Dict[str, Any]:
         """
@@ -65,11 +133,11 @@ class APIMonitor:
         """
         try:
             start_time = time.time()
-            response = requests.get(f"{self.api_url}/health", timeout=10)
+            response = self.session.get(f"{self.api_url}/health", timeout=10)
             response_time = time.time() - start_time
 
             health_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "status_code": response.status_code,
                 "response_time": response_time,
                 "is_healthy": response.status_code == 200,
@@ -95,41 +163,47 @@ class APIMonitor:
                 response_data=health_data.get("response_data"),
             )
 
-            self.metrics.append(health_data)
+            self._record_metric(health_data)
             return health_data
 
         except Exception as e:
             error_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "error": str(e),
                 "is_healthy": False,
             }
             self.logger.error(f"Health check error: {str(e)}")
-            self.metrics.append(error_data)
+            self._record_metric(error_data)
             return error_data
 
-    def test_prediction(self, sample_data: Dict[str, float]) -> Dict[str, Any]:
+    def test_prediction(
+        self, sample_data: Union[Dict[str, float], bytes]
+    ) -> Dict[str, Any]:
         """
         Test prediction endpoint
 
         Args:
-            sample_data: Sample input data for prediction
+            sample_data: Sample input data for prediction, or its already
+                serialized JSON body
 
         Returns:
             Dict containing prediction test results
         """
+        if not isinstance(sample_data, bytes):
+            sample_data = json.dumps(sample_data).encode()
+
         try:
             start_time = time.time()
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/predict",
-                json=sample_data,
-                headers={"Content-Type": "application/json"},
+                data=sample_data,
+                headers=JSON_HEADERS,
                 timeout=10,
             )
             response_time = time.time() - start_time
 
             prediction_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "status_code": response.status_code,
                 "response_time": response_time,
                 "success": response.status_code == 200,
@@ -150,7 +224,7 @@ class APIMonitor:
 
         except Exception as e:
             error_data = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "error": str(e),
                 "success": False,
             }
@@ -180,6 +254,9 @@ class APIMonitor:
             "Longitude": -122.23,
         }
 
+        # Serialize the request body once rather than on every prediction test
+        payload = json.dumps(sample_data).encode()
+
         end_time = time.time() + (duration_minutes * 60)
 
         while time.time() < end_time:
@@ -187,27 +264,34 @@ class APIMonitor:
             self.health_check()
 
             # Prediction test
-            self.test_prediction(sample_data)
+            self.test_prediction(payload)
 
             # Wait for next cycle
             time.sleep(interval_seconds)
 
         self.logger.info("Monitoring cycle completed")
+        self.session.close()
         self.save_metrics()
 
-    def save_metrics(self, filename: str = "logs/api_metrics.json"):
+    def save_metrics(self, filename: str = "logs/api_metrics.jsonl"):
         """
-        Save collected metrics to file
+        Append metrics collected since the last save to a JSON Lines file
 
         Args:
             filename: Path to save metrics
         """
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-        with open(filename, "w") as f:
-            json.dump(self.metrics, f, indent=2)
+        # Records that fell out of the buffer before being saved are lost
+        new_records = min(
+            self._metrics_recorded - self._metrics_saved, len(self.metrics)
+        )
+        with open(filename, "a") as f:
+            for record in islice(self.metrics, len(self.metrics) - new_records, None):
+                f.write(json.dumps(record) + "\n")
+        self._metrics_saved = self._metrics_recorded
 
-        self.logger.info(f"Metrics saved to {filename}")
+        self.logger.info(f"{new_records} new metrics appended to {filename}")
 
     def generate_report(self, output_dir: str = "reports"):
         """
@@ -223,64 +307,56 @@ class APIMonitor:
         os.makedirs(output_dir, exist_ok=True)
 
         # Convert metrics to DataFrame
-        df = pd.DataFrame(self.metrics)
+        df = pd.DataFrame.from_records(self.metrics, columns=METRIC_COLUMNS).astype(
+            METRIC_DTYPES
+        )
+        has_response_times = bool(df["response_time"].notna().any())
 
-        if "response_time" in df.columns:
+        if has_response_times:
             # Response time analysis
-            plt.figure(figsize=(12, 8))
-
-            plt.subplot(2, 2, 1)
-            plt.plot(df.index, df["response_time"])
-            plt.title("API Response Time Over Time")
-            plt.xlabel("Request Number")
-            plt.ylabel("Response Time (seconds)")
-
-            plt.subplot(2, 2, 2)
-            plt.hist(df["response_time"], bins=20, alpha=0.7)
-            plt.title("Response Time Distribution")
-            plt.xlabel("Response Time (seconds)")
-            plt.ylabel("Frequency")
-
-            plt.subplot(2, 2, 3)
-            success_rate = df["is_healthy"].mean() if "is_healthy" in df.columns else 0
-            plt.bar(["Success", "Failure"], [success_rate, 1 - success_rate])
-            plt.title("API Health Success Rate")
-            plt.ylabel("Rate")
-
-            plt.subplot(2, 2, 4)
-            if "response_time" in df.columns:
-                plt.boxplot(df["response_time"])
-                plt.title("Response Time Box Plot")
-                plt.ylabel("Response Time (seconds)")
-
-            plt.tight_layout()
-            plt.savefig(
+            response_times = df["response_time"].dropna()
+            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
+
+            ax1.plot(df.index, df["response_time"])
+            ax1.set_title("API Response Time Over Time")
+            ax1.set_xlabel("Request Number")
+            ax1.set_ylabel("Response Time (seconds)")
+
+            ax2.hist(response_times, bins=20, alpha=0.7)
+            ax2.set_title("Response Time Distribution")
+            ax2.set_xlabel("Response Time (seconds)")
+            ax2.set_ylabel("Frequency")
+
+            success_rate = _optional_float(df["is_healthy"].mean()) or 0
+            ax3.bar(["Success", "Failure"], [success_rate, 1 - success_rate])
+            ax3.set_title("API Health Success Rate")
+            ax3.set_ylabel("Rate")
+
+            ax4.boxplot(response_times)
+            ax4.set_title("Response Time Box Plot")
+            ax4.set_ylabel("Response Time (seconds)")
+
+            fig.tight_layout()
+            fig.savefig(
                 f"{output_dir}/api_monitoring_report.png", dpi=300, bbox_inches="tight"
             )
-            plt.close()
+            plt.close(fig)
 
             self.logger.info(
                 f"Monitoring report saved to {output_dir}/api_monitoring_report.png"
             )
 
         # Generate summary statistics
+        timestamps = df["timestamp"].dropna()
         summary = {
             "total_requests": len(df),
-            "average_response_time": (
-                df["response_time"].mean() if "response_time" in df.columns else None
-            ),
-            "max_response_time": (
-                df["response_time"].max() if "response_time" in df.columns else None
-            ),
-            "min_response_time": (
-                df["response_time"].min() if "response_time" in df.columns else None
-            ),
-            "success_rate": (
-                df["is_healthy"].mean() if "is_healthy" in df.columns else None
-            ),
+            "average_response_time": _optional_float(df["response_time"].mean()),
+            "max_response_time": _optional_float(df["response_time"].max()),
+            "min_response_time": _optional_float(df["response_time"].min()),
+            "success_rate": _optional_float(df["is_healthy"].mean()),
             "monitoring_period": {
-                "start": df["timestamp"].min() if "timestamp" in df.columns else None,
-                "end": df["timestamp"].max() if "timestamp" in df.columns else None,
+                "start": _optional_value(timestamps.min()),
+                "end": _optional_value(timestamps.max()),
             },
         }
 
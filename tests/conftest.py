@@ -0,0 +1,36 @@
+"""
+Shared pytest fixtures
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from data_preprocessing import load_california_housing_data  # noqa: E402
+
+# Expected California Housing feature columns, in dataset order
+FEATURE_NAMES = (
+    "MedInc",
+    "HouseAge",
+    "AveRooms",
+    "AveBedrms",
+    "Population",
+    "AveOccup",
+    "Latitude",
+    "Longitude",
+)
+
+
+@pytest.fixture(scope="session")
+def feature_names():
+    """Expected California Housing feature names"""
+    return FEATURE_NAMES
+
+
+@pytest.fixture(scope="session")
+def housing_data():
+    """Load the California housing dataset once per test session"""
+    return load_california_housing_data()
@@ -7,6 +7,7 @@ import os
 import sys
 
 import joblib
+import numpy as np
 import pandas as pd
 import pytest
 from sklearn.ensemble import RandomForestRegressor
@@ -14,18 +15,19 @@ from sklearn.preprocessing import StandardScaler
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import api  # noqa: E402
 from api import app, load_model_and_scaler  # noqa: E402
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client"""
+    """Create a test client shared by the tests in this module"""
     app.config["TESTING"] = True
     with app.test_client() as client:
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data():
     """Sample input data for testing"""
     return {
@@ -40,29 +42,31 @@ def sample_data():
     }
 
 
-@pytest.fixture
-def setup_test_model():
-    """Set up test model and scaler"""
-    # Create temporary directories
-    os.makedirs("models", exist_ok=True)
-    os.makedirs("data", exist_ok=True)
+@pytest.fixture(scope="session")
+def sample_payload(sample_data):
+    """Sample input data encoded once as a JSON request body"""
+    return json.dumps(sample_data).encode()
+
+
+@pytest.fixture(scope="session")
+def large_batch_payload(sample_data):
+    """Batch request body of 1024 identical instances, encoded once"""
+    features = list(sample_data)
+    rows = np.tile(np.fromiter(sample_data.values(), dtype=np.float64), (1024, 1))
+    instances = [dict(zip(features, row)) for row in rows.tolist()]
+    return json.dumps({"instances": instances}).encode()
 
+
+@pytest.fixture(scope="session")
+def setup_test_model(feature_names):
+    """Set up test model and scaler once per test session"""
     # Create a simple test model
     model = RandomForestRegressor(n_estimators=10, random_state=42)
 
     # Create test data
-    feature_names = [
-        "MedInc",
-        "HouseAge",
-        "AveRooms",
-        "AveBedrms",
-        "Population",
-        "AveOccup",
-        "Latitude",
-        "Longitude",
-    ]
     X_test = pd.DataFrame(
-        [[8.3252, 41.0, 6.98, 1.02, 322.0, 2.55, 37.88, -122.23]], columns=feature_names
+        [[8.3252, 41.0, 6.98, 1.02, 322.0, 2.55, 37.88, -122.23]],
+        columns=list(feature_names),
     )
     y_test = [4.526]
 
@@ -73,22 +77,43 @@ def setup_test_model():
     scaler = StandardScaler()
     scaler.fit(X_test)
 
+    return model, scaler, feature_names
+
+
+@pytest.fixture(scope="session")
+def model_files(tmp_path_factory, setup_test_model):
+    """Save the test model, scaler and training features for the on-disk load path"""
+    model, scaler, feature_names = setup_test_model
+
+    # A per-session temporary directory (per worker under pytest-xdist) keeps
+    # the test artifacts away from the real models/ and data/ files
+    artifact_dir = tmp_path_factory.mktemp("api_artifacts")
+    model_path = str(artifact_dir / "best_model.pkl")
+    scaler_path = str(artifact_dir / "scaler.pkl")
+    feature_data_path = str(artifact_dir / "X_train.csv")
+
     # Save model and scaler
-    joblib.dump(model, "models/best_model.pkl")
-    joblib.dump(scaler, "data/scaler.pkl")
+    joblib.dump(model, model_path)
+    joblib.dump(scaler, scaler_path)
+
+    # Save the training data header the API reads feature names from
+    pd.DataFrame(columns=feature_names).to_csv(feature_data_path, index=False)
 
-    # Save sample training data
-    X_test.to_csv("data/X_train.csv", index=False)
+    # Point the API at the test artifacts for the rest of the session
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(api, "MODEL_PATH", model_path)
+        mp.setattr(api, "SCALER_PATH", scaler_path)
+        mp.setattr(api, "FEATURE_DATA_PATH", feature_data_path)
+        yield
 
-    yield
 
-    # Cleanup
-    if os.path.exists("models/best_model.pkl"):
-        os.remove("models/best_model.pkl")
-    if os.path.exists("data/scaler.pkl"):
-        os.remove("data/scaler.pkl")
-    if os.path.exists("data/X_train.csv"):
-        os.remove("data/X_train.csv")
+@pytest.fixture
+def loaded_model(monkeypatch, setup_test_model):
+    """Install the test model and scaler in the API without reading them from disk"""
+    # Register the current globals so they are restored after the test
+    for name in ("model", "scaler", "feature_names"):
+        monkeypatch.setattr(api, name, getattr(api, name))
+    api.set_model(*setup_test_model)
 
 
 def test_home_endpoint(client):
@@ -114,10 +139,10 @@ def test_info_endpoint_without_model(client):
     assert response.status_code in [200, 500]
 
 
-def test_predict_without_model(client, sample_data):
+def test_predict_without_model(client, sample_payload):
     """Test prediction endpoint without model loaded"""
     response = client.post(
-        "/predict", data=json.dumps(sample_data), content_type="application/json"
+        "/predict", data=sample_payload, content_type="application/json"
     )
     assert response.status_code == 500
 
@@ -130,10 +155,8 @@ def test_predict_invalid_json(client):
     assert response.status_code == 400
 
 
-def test_predict_missing_features(client, setup_test_model):
+def test_predict_missing_features(client, loaded_model):
     """Test prediction with missing features"""
-    load_model_and_scaler()
-
     incomplete_data = {
         "MedInc": 8.3252,
         "HouseAge": 41.0,
@@ -146,10 +169,8 @@ def test_predict_missing_features(client, setup_test_model):
     assert response.status_code == 400
 
 
-def test_predict_invalid_feature_values(client, setup_test_model):
+def test_predict_invalid_feature_values(client, loaded_model):
     """Test prediction with invalid feature values"""
-    load_model_and_scaler()
-
     invalid_data = {
         "MedInc": "not_a_number",
         "HouseAge": 41.0,
@@ -196,21 +217,28 @@ def test_404_endpoint(client):
 
 
 # Integration tests with model loaded
-def test_health_with_model(client, setup_test_model):
-    """Test health endpoint with model loaded"""
-    # Load model and scaler
+def test_load_model_and_scaler(monkeypatch, model_files, feature_names):
+    """Test the model, scaler and feature names are loaded from disk"""
+    for name in ("model", "scaler", "feature_names"):
+        monkeypatch.setattr(api, name, None)
+
     load_model_and_scaler()
 
+    assert isinstance(api.model, RandomForestRegressor)
+    assert isinstance(api.scaler, StandardScaler)
+    assert api.feature_names == list(feature_names)
+
+
+def test_health_with_model(client, loaded_model):
+    """Test health endpoint with model loaded"""
     response = client.get("/health")
     assert response.status_code == 200
     data = json.loads(response.data)
     assert data["status"] == "healthy"
 
 
-def test_info_with_model(client, setup_test_model):
+def test_info_with_model(client, loaded_model):
     """Test info endpoint with model loaded"""
-    load_model_and_scaler()
-
     response = client.get("/info")
     assert response.status_code == 200
     data = json.loads(response.data)
@@ -219,12 +247,10 @@ def test_info_with_model(client, setup_test_model):
     assert data["model_loaded"] is True
 
 
-def test_predict_with_model(client, setup_test_model, sample_data):
+def test_predict_with_model(client, loaded_model, sample_payload):
     """Test prediction with model loaded"""
-    load_model_and_scaler()
-
     response = client.post(
-        "/predict", data=json.dumps(sample_data), content_type="application/json"
+        "/predict", data=sample_payload, content_type="application/json"
     )
     assert response.status_code == 200
     data = json.loads(response.data)
@@ -232,10 +258,8 @@ def test_predict_with_model(client, setup_test_model, sample_data):
     assert isinstance(data["prediction"], (int, float))
 
 
-def test_batch_predict_with_model(client, setup_test_model, sample_data):
+def test_batch_predict_with_model(client, loaded_model, sample_data):
     """Test batch prediction with model loaded"""
-    load_model_and_scaler()
-
     batch_data = {"instances": [sample_data, sample_data]}
 
     response = client.post(
@@ -246,3 +270,14 @@ def test_batch_predict_with_model(client, setup_test_model, sample_data):
     assert "predictions" in data
     assert len(data["predictions"]) == 2
     assert all(isinstance(p, (int, float)) for p in data["predictions"])
+
+
+def test_batch_predict_large(client, loaded_model, large_batch_payload):
+    """Test batch prediction on a large batch of identical instances"""
+    response = client.post(
+        "/predict_batch", data=large_batch_payload, content_type="application/json"
+    )
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data["n_predictions"] == 1024
+    assert len(set(data["predictions"])) == 1
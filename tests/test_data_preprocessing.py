@@ -7,13 +7,15 @@ import shutil
 import sys
 import tempfile
 
+import numpy as np
 import pandas as pd
 import pytest
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import data_preprocessing  # noqa: E402
 from data_preprocessing import (  # noqa: E402
-    load_california_housing_data,
+    load_cached_splits,
     load_processed_data,
     preprocess_data,
     save_processed_data,
@@ -28,9 +30,9 @@ def temp_data_dir():
     shutil.rmtree(temp_dir)
 
 
-def test_load_california_housing_data():
+def test_load_california_housing_data(housing_data, feature_names):
     """Test loading California housing data"""
-    X, y = load_california_housing_data()
+    X, y = housing_data
 
     # Check data types
     assert isinstance(X, pd.DataFrame)
@@ -42,17 +44,7 @@ def test_load_california_housing_data():
     assert len(y) == X.shape[0]
 
     # Check feature names
-    expected_features = [
-        "MedInc",
-        "HouseAge",
-        "AveRooms",
-        "AveBedrms",
-        "Population",
-        "AveOccup",
-        "Latitude",
-        "Longitude",
-    ]
-    assert list(X.columns) == expected_features
+    assert list(X.columns) == list(feature_names)
 
     # Check target name
     assert y.name == "target"
@@ -62,10 +54,9 @@ def test_load_california_housing_data():
     assert not y.isnull().any()
 
 
-def test_preprocess_data():
+def test_preprocess_data(housing_data):
     """Test data preprocessing function"""
-    # Load test data
-    X, y = load_california_housing_data()
+    X, y = housing_data
 
     # Preprocess data
     X_train, X_test, y_train, y_test, scaler = preprocess_data(
@@ -106,9 +97,9 @@ def test_preprocess_data():
     ), f"Stds not close to 1: {train_stds}"
 
 
-def test_preprocess_data_different_test_size():
+def test_preprocess_data_different_test_size(housing_data):
     """Test preprocessing with different test size"""
-    X, y = load_california_housing_data()
+    X, y = housing_data
 
     test_size = 0.1
     X_train, X_test, y_train, y_test, scaler = preprocess_data(
@@ -122,10 +113,10 @@ def test_preprocess_data_different_test_size():
     assert len(y_test) == expected_test_size
 
 
-def test_save_and_load_processed_data(temp_data_dir):
+def test_save_and_load_processed_data(housing_data, temp_data_dir):
     """Test saving and loading processed data"""
-    # Load and preprocess data
-    X, y = load_california_housing_data()
+    # Preprocess data
+    X, y = housing_data
     X_train, X_test, y_train, y_test, scaler = preprocess_data(X, y)
 
     # Save processed data
@@ -166,13 +157,53 @@ def test_save_and_load_processed_data(temp_data_dir):
     )
 
     # Check scaler parameters match
-    assert scaler.mean_.tolist() == scaler_loaded.mean_.tolist()
-    assert scaler.scale_.tolist() == scaler_loaded.scale_.tolist()
+    np.testing.assert_array_equal(scaler.mean_, scaler_loaded.mean_)
+    np.testing.assert_array_equal(scaler.scale_, scaler_loaded.scale_)
+
+
+@pytest.mark.skipif(
+    data_preprocessing.CSV_ENGINE != "pyarrow", reason="pyarrow not installed"
+)
+def test_parquet_sidecars_match_csv(housing_data, temp_data_dir):
+    """Test the Parquet sidecars load the same splits as the CSVs"""
+    X, y = housing_data
+    X_train, X_test, y_train, y_test, scaler = preprocess_data(X, y)
+    save_processed_data(X_train, X_test, y_train, y_test, scaler, temp_data_dir)
+    from_parquet = load_processed_data(temp_data_dir)
+
+    for file in ("X_train", "X_test", "y_train", "y_test"):
+        os.remove(os.path.join(temp_data_dir, f"{file}.parquet"))
+    from_csv = load_processed_data(temp_data_dir)
+
+    pd.testing.assert_frame_equal(from_parquet[0], from_csv[0])
+    pd.testing.assert_frame_equal(from_parquet[1], from_csv[1])
+    pd.testing.assert_series_equal(from_parquet[2], from_csv[2])
+    pd.testing.assert_series_equal(from_parquet[3], from_csv[3])
 
 
-def test_reproducibility():
+def test_load_cached_splits(housing_data, temp_data_dir):
+    """Test that saved splits are returned as-is without re-splitting"""
+    X, y = housing_data
+    X_train, X_test, y_train, y_test, scaler = preprocess_data(X, y)
+    save_processed_data(X_train, X_test, y_train, y_test, scaler, temp_data_dir)
+
+    cached_splits = load_cached_splits(data_dirs=(temp_data_dir,))
+    assert cached_splits is not None
+
+    X_train_cached, X_test_cached, y_train_cached, y_test_cached = cached_splits
+    assert X_train_cached.shape == X_train.shape
+    assert X_test_cached.shape == X_test.shape
+    assert len(y_train_cached) == len(y_train)
+    assert len(y_test_cached) == len(y_test)
+
+    # Directories without a complete set of split files are skipped
+    os.remove(os.path.join(temp_data_dir, "y_test.csv"))
+    assert load_cached_splits(data_dirs=(temp_data_dir,)) is None
+
+
+def test_reproducibility(housing_data):
     """Test that preprocessing is reproducible with same random state"""
-    X, y = load_california_housing_data()
+    X, y = housing_data
 
     # Preprocess data twice with same random state
     X_train1, X_test1, y_train1, y_test1, scaler1 = preprocess_data(
@@ -189,9 +220,26 @@ def test_reproducibility():
     pd.testing.assert_series_equal(y_test1, y_test2)
 
 
-def test_different_random_states():
+def test_preprocess_data_prefit_scaler(housing_data):
+    """Test a prefit scaler is reused instead of refitted"""
+    X, y = housing_data
+
+    X_train1, X_test1, _, _, scaler1 = preprocess_data(X, y, random_state=42)
+    X_train2, X_test2, _, _, scaler2 = preprocess_data(
+        X, y, random_state=42, prefit_scaler=scaler1
+    )
+
+    # The prefit scaler is returned (a copy when PREPROCESS_CACHE_DIR is set)
+    # and applied to both splits
+    np.testing.assert_array_equal(scaler2.mean_, scaler1.mean_)
+    np.testing.assert_array_equal(scaler2.scale_, scaler1.scale_)
+    pd.testing.assert_frame_equal(X_train1, X_train2)
+    pd.testing.assert_frame_equal(X_test1, X_test2)
+
+
+def test_different_random_states(housing_data):
     """Test that different random states produce different splits"""
-    X, y = load_california_housing_data()
+    X, y = housing_data
 
     # Preprocess data with different random states
     X_train1, X_test1, y_train1, y_test1, scaler1 = preprocess_data(
@@ -206,9 +254,9 @@ def test_different_random_states():
     assert not X_train1.iloc[:5].equals(X_train2.iloc[:5])
 
 
-def test_scaler_transform_consistency():
+def test_scaler_transform_consistency(housing_data):
     """Test that scaler transforms data consistently"""
-    X, y = load_california_housing_data()
+    X, y = housing_data
     X_train, X_test, y_train, y_test, scaler = preprocess_data(X, y)
 
     # Apply scaler manually to original training data
@@ -216,5 +264,5 @@ def test_scaler_transform_consistency():
         scaler.transform(scaler.inverse_transform(X_train)), columns=X_train.columns
     )
 
-    # Should be very close to the processed training data
-    pd.testing.assert_frame_equal(X_train, X_train_manual, rtol=1e-10)
+    # Should be very close to the processed training data (float32 precision)
+    pd.testing.assert_frame_equal(X_train, X_train_manual, rtol=1e-5, atol=1e-6)
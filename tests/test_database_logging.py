@@ -0,0 +1,187 @@
+"""
+Unit tests for database logging module
+"""
+
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import pytest
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import database_logging  # noqa: E402
+from database_logging import (  # noqa: E402
+    AsyncDBHandler,
+    DatabaseLogHandler,
+    InMemoryDatabaseLogger,
+)
+
+
+@pytest.fixture
+def memory_logger():
+    """Create an in-memory database logger"""
+    db_logger = InMemoryDatabaseLogger(":memory:")
+    yield db_logger
+    db_logger.close()
+
+
+@pytest.fixture
+def file_logger():
+    """Create a database logger backed by a temporary file"""
+    temp_dir = tempfile.mkdtemp()
+    db_logger = InMemoryDatabaseLogger(os.path.join(temp_dir, "logs.db"))
+    yield db_logger
+    db_logger.close()
+    shutil.rmtree(temp_dir)
+
+
+def _pragma(db_logger, name):
+    return db_logger.connection.execute(f"PRAGMA {name}").fetchone()[0]
+
+
+def test_memory_database_pragmas(memory_logger):
+    """Test in-memory databases skip syncing and keep the journal in memory"""
+    assert _pragma(memory_logger, "journal_mode") == "memory"
+    assert _pragma(memory_logger, "synchronous") == 0  # OFF
+    assert _pragma(memory_logger, "temp_store") == 2  # MEMORY
+
+
+def test_file_database_pragmas(file_logger):
+    """Test file databases use write-ahead logging"""
+    assert _pragma(file_logger, "journal_mode") == "wal"
+    assert _pragma(file_logger, "synchronous") == 1  # NORMAL
+
+
+def test_logged_metrics_are_stored(memory_logger):
+    """Test queued API and model metrics are readable after logging"""
+    for status_code in (200, 200, 500):
+        memory_logger.log_api_metric(
+            endpoint="/predict",
+            method="POST",
+            status_code=status_code,
+            response_time=0.01,
+            success=status_code == 200,
+        )
+    memory_logger.log_model_metric(
+        model_name="rf",
+        model_type="RandomForestRegressor",
+        rmse=0.5,
+        mae=0.4,
+        r2_score=0.8,
+        training_time=1.0,
+        parameters={"n_estimators": 100},
+    )
+
+    stats = memory_logger.get_database_stats()
+    assert stats["api_metrics"]["total_requests"] == 3
+    assert stats["api_metrics"]["successful_requests"] == 2
+    assert stats["total_model_metrics"] == 1
+    assert len(memory_logger.get_api_metrics(endpoint="/predict")) == 3
+
+
+def test_log_api_metrics_bulk(memory_logger):
+    """Test bulk-logged API metrics are all stored"""
+    memory_logger.log_api_metrics_bulk(
+        [
+            {
+                "endpoint": "/predict",
+                "method": "POST",
+                "status_code": 200,
+                "response_time": 0.01 * i,
+                "success": True,
+                "request_data": {"row": i},
+            }
+            for i in range(100)
+        ]
+    )
+    memory_logger.log_api_metrics_bulk([])
+
+    metrics = memory_logger.get_api_metrics(limit=1000)
+    assert len(metrics) == 100
+    rows = {json.loads(metric["request_data"])["row"] for metric in metrics}
+    assert rows == set(range(100))
+
+
+@pytest.mark.parametrize("handler_class", [DatabaseLogHandler, AsyncDBHandler])
+def test_handler_stores_records(memory_logger, handler_class):
+    """Test records queued by the logging handlers are stored after a flush"""
+    logger = logging.getLogger("test_db_handler")
+    logger.propagate = False
+    handler = handler_class(memory_logger)
+    logger.addHandler(handler)
+    try:
+        logger.warning("Drift score %.2f", 0.25, extra={"feature": "MedInc"})
+        logger.error("Plain message")
+    finally:
+        logger.removeHandler(handler)
+
+    memory_logger.flush()
+    logs = memory_logger.get_logs(limit=10, module="test_db_handler")
+    assert {log["message"] for log in logs} == {"Drift score 0.25", "Plain message"}
+    warning = next(log for log in logs if log["level"] == "WARNING")
+    assert json.loads(warning["extra_data"]) == {"feature": "MedInc"}
+
+
+def test_close_stops_exit_flush():
+    """Test closed loggers are no longer flushed at interpreter exit"""
+    db_logger = InMemoryDatabaseLogger(":memory:")
+    assert db_logger in database_logging._live_loggers
+
+    db_logger.close()
+    assert db_logger not in database_logging._live_loggers
+
+
+def test_flush_returns_under_steady_logging(memory_logger):
+    """Test flush waits only for inserts queued before it was called"""
+    assert memory_logger._write_queue.maxsize == database_logging.WRITE_QUEUE_SIZE
+    memory_logger.log_message("INFO", "test", "before flush")
+
+    stop = threading.Event()
+
+    def keep_logging():
+        while not stop.is_set():
+            memory_logger.log_message("INFO", "test", "during flush")
+
+    logging_thread = threading.Thread(target=keep_logging)
+    logging_thread.start()
+    try:
+        flush_thread = threading.Thread(target=memory_logger.flush)
+        flush_thread.start()
+        flush_thread.join(timeout=10)
+        assert not flush_thread.is_alive()
+    finally:
+        stop.set()
+        logging_thread.join()
+
+    messages = {log["message"] for log in memory_logger.get_logs(limit=10**6)}
+    assert "before flush" in messages
+
+
+class _Unbindable:
+    """Value whose conversion for SQLite raises a non-sqlite3 exception"""
+
+    def __conform__(self, protocol):
+        raise ValueError("cannot bind")
+
+
+def test_unbindable_row_does_not_drop_batch(memory_logger):
+    """Test a row that cannot be bound is skipped without losing the others"""
+    sql = database_logging.INSERT_LOG_SQL
+    memory_logger._enqueue_writes(
+        sql,
+        [
+            ("INFO", "test", "first", None),
+            ("INFO", "test", _Unbindable(), None),
+            ("INFO", "test", "second", None),
+        ],
+    )
+    memory_logger.log_message("INFO", "test", "next batch")
+
+    messages = {log["message"] for log in memory_logger.get_logs(module="test")}
+    assert messages == {"first", "second", "next batch"}
+    assert not memory_logger.connection.in_transaction
@@ -0,0 +1,227 @@
+"""
+Unit tests for model training module
+"""
+
+import os
+import sys
+
+import joblib
+import mlflow
+import numpy as np
+import pandas as pd
+import pytest
+from mlflow.tracking import MlflowClient
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+import model_training  # noqa: E402
+from model_training import (  # noqa: E402
+    _load_warm_start_forest,
+    _split_fingerprint,
+    cached_fit,
+    evaluate_model,
+    train_linear_regression,
+    train_random_forest,
+)
+
+
+def test_evaluate_model_matches_sklearn():
+    """Test single-pass metrics against scikit-learn's implementations"""
+    rng = np.random.default_rng(42)
+    y_true = pd.Series(rng.uniform(0.5, 5.0, 1000).astype(np.float32))
+    y_pred = y_true.to_numpy() + rng.normal(0, 0.5, 1000)
+
+    metrics = evaluate_model(y_true, y_pred)
+
+    assert metrics["rmse"] == pytest.approx(np.sqrt(mean_squared_error(y_true, y_pred)))
+    assert metrics["mae"] == pytest.approx(mean_absolute_error(y_true, y_pred))
+    assert metrics["r2"] == pytest.approx(r2_score(y_true, y_pred))
+    assert all(isinstance(value, float) for value in metrics.values())
+
+
+def test_error_sums_kernel_matches_numpy():
+    """Test the Numba-compiled kernel agrees with the NumPy sums"""
+    rng = np.random.default_rng(0)
+    y_true = rng.uniform(0.5, 5.0, 10_000)
+    y_pred = y_true + rng.normal(0, 0.5, 10_000)
+
+    expected = model_training._error_sums_numpy(y_true, y_pred)
+    actual = model_training._error_sums(y_true, y_pred)
+
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+
+def test_evaluate_model_rejects_empty_input():
+    """Test empty targets raise a ValueError"""
+    with pytest.raises(ValueError, match="empty"):
+        evaluate_model([], [])
+
+
+def test_evaluate_model_rejects_length_mismatch():
+    """Test targets and predictions of different lengths raise a ValueError"""
+    with pytest.raises(ValueError, match="different lengths"):
+        evaluate_model([1.0, 2.0, 3.0], [1.0, 2.0])
+
+
+@pytest.mark.parametrize("bad_value", [np.nan, np.inf])
+def test_evaluate_model_rejects_non_finite_input(bad_value):
+    """Test NaN or infinite targets and predictions raise a ValueError"""
+    with pytest.raises(ValueError, match="NaN or infinity"):
+        evaluate_model([1.0, bad_value, 3.0], [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError, match="NaN or infinity"):
+        evaluate_model([1.0, 2.0, 3.0], [1.0, 2.0, bad_value])
+
+
+def test_evaluate_model_constant_target():
+    """Test R2 on a constant target follows scikit-learn's convention"""
+    assert evaluate_model([2.0, 2.0, 2.0], [2.0, 2.0, 2.0])["r2"] == 1.0
+    assert evaluate_model([2.0, 2.0, 2.0], [1.0, 2.0, 2.0])["r2"] == 0.0
+
+
+@pytest.fixture
+def regression_data():
+    """Small linear regression problem"""
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(rng.normal(size=(100, 3)), columns=["a", "b", "c"])
+    y = pd.Series(X.to_numpy() @ [1.0, -2.0, 0.5] + 3.0)
+    return X, y
+
+
+def test_cached_fit_reuses_fitted_model(tmp_path, regression_data):
+    """Test an identical fit is loaded from the cache instead of refitted"""
+    X, y = regression_data
+    first = cached_fit(LinearRegression(), X, y, cache_dir=str(tmp_path))
+
+    unfitted = LinearRegression()
+    second = cached_fit(unfitted, X, y, cache_dir=str(tmp_path))
+
+    assert second is not unfitted
+    assert not hasattr(unfitted, "coef_")
+    np.testing.assert_array_equal(second.coef_, first.coef_)
+    assert [path.suffix for path in tmp_path.iterdir()] == [".pkl"]
+
+
+def test_cached_fit_misses_on_changed_params_or_data(tmp_path, regression_data):
+    """Test changing the parameters or the training data refits the model"""
+    X, y = regression_data
+    cached_fit(LinearRegression(), X, y, cache_dir=str(tmp_path))
+
+    model = LinearRegression(fit_intercept=False)
+    assert cached_fit(model, X, y, cache_dir=str(tmp_path)) is model
+
+    model = LinearRegression()
+    assert cached_fit(model, X, y * 2, cache_dir=str(tmp_path)) is model
+    assert len(list(tmp_path.iterdir())) == 3
+
+
+def test_cached_fit_disabled_without_cache_dir(monkeypatch, tmp_path, regression_data):
+    """Test the cache is skipped when MODEL_CACHE_DIR is not set"""
+    monkeypatch.setattr(model_training, "MODEL_CACHE_DIR", None)
+    monkeypatch.chdir(tmp_path)
+    X, y = regression_data
+
+    model = LinearRegression()
+    assert cached_fit(model, X, y) is model
+    assert hasattr(model, "coef_")
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.fixture
+def mlflow_store(monkeypatch, tmp_path):
+    """Point MLflow at a temporary file store for the test"""
+    monkeypatch.delenv("GITHUB_ACTIONS", raising=False)
+    monkeypatch.setattr(model_training, "to_onnx", None)
+    previous_uri = mlflow.get_tracking_uri()
+    mlflow.set_tracking_uri((tmp_path / "mlruns").as_uri())
+    mlflow.set_experiment("model_training_tests")
+    yield
+    mlflow.set_tracking_uri(previous_uri)
+
+
+def test_direct_training_uploads_model(mlflow_store, regression_data):
+    """Test a train_* function called directly logs its model to the run"""
+    X, y = regression_data
+
+    train_linear_regression(X, y, X, y)
+
+    run_id = mlflow.last_active_run().info.run_id
+    artifacts = MlflowClient().list_artifacts(run_id)
+    assert [artifact.path for artifact in artifacts] == ["model"]
+
+
+@pytest.fixture
+def warm_start_forest(monkeypatch, tmp_path, mlflow_store, regression_data):
+    """Train a small forest and save it where RF_WARM_START looks for it"""
+    X, y = regression_data
+    path = tmp_path / "random_forest_model.pkl"
+    monkeypatch.setattr(model_training, "RF_WARM_START_PATH", str(path))
+    # Saving the MLflow model dominates the runtime and is not under test
+    monkeypatch.setattr(model_training, "_log_model", lambda *args: None)
+
+    model, _ = train_random_forest(X, y, X, y, n_estimators=10, n_jobs=1)
+    joblib.dump(model, path)
+    return path
+
+
+def test_warm_start_grows_saved_forest(warm_start_forest, regression_data):
+    """Test a compatible saved forest is grown instead of refitted"""
+    X, y = regression_data
+
+    model, _ = train_random_forest(
+        X, y, X, y, n_estimators=10, n_jobs=1, warm_start_increment=5
+    )
+
+    assert model.n_estimators == 15
+    assert len(model.estimators_) == 15
+    params = mlflow.get_run(mlflow.last_active_run().info.run_id).data.params
+    assert params["warm_started"] == "True"
+    assert params["previous_n_estimators"] == "10"
+
+
+def test_warm_start_loads_compatible_forest(warm_start_forest, regression_data):
+    """Test the saved forest is loaded for the split it was fitted against"""
+    X, y = regression_data
+    split = _split_fingerprint(X, y)
+
+    model = _load_warm_start_forest(str(warm_start_forest), 3, 10, 42, split, 5)
+
+    assert model is not None
+    assert model.n_estimators == 10
+
+
+@pytest.mark.parametrize(
+    "n_features, max_depth, random_state, split_changed, increment",
+    [
+        (4, 10, 42, False, 5),  # different features
+        (3, 5, 42, False, 5),  # different tree depth
+        (3, 10, 0, False, 5),  # different seed
+        (3, 10, 42, True, 5),  # different train/test split
+        (3, 10, 42, False, 1000),  # grows past RF_WARM_START_MAX_TREES
+    ],
+)
+def test_warm_start_falls_back_on_mismatch(
+    warm_start_forest,
+    regression_data,
+    n_features,
+    max_depth,
+    random_state,
+    split_changed,
+    increment,
+):
+    """Test incompatible saved forests are not grown"""
+    X, y = regression_data
+    split = _split_fingerprint(X.iloc[1:] if split_changed else X, y)
+
+    model = _load_warm_start_forest(
+        str(warm_start_forest), n_features, max_depth, random_state, split, increment
+    )
+
+    assert model is None
+
+
+def test_warm_start_without_saved_forest(tmp_path):
+    """Test a missing saved forest falls back to training from scratch"""
+    path = str(tmp_path / "missing.pkl")
+    assert _load_warm_start_forest(path, 3, 10, 42, "", 5) is None